@@ -1,25 +1,206 @@
 """
 Read-only API server for the signal-extract web UI.
-Reads from the existing SQLite database. Never writes.
+Reads from the existing SQLite database over read-only connections.
+Storage has already put it in WAL mode, so these never block the collector.
 
 Run: python main.py serve
 """
 
-import json
+import functools
+import queue
 import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 
-from flask import Flask, jsonify, request, send_from_directory
+import orjson
+from flask import Flask, Response, request, send_from_directory
+from flask.json.provider import JSONProvider
+
+from storage.db import (
+    OPPORTUNITY_TRENDS_SQL,
+    ORDERED_AGGREGATES,
+    opportunity_text_filter,
+    sorted_trend_points,
+)
+
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    Compact output, no key sorting. Responses are built from bytes directly.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype="application/json"
+        )
+
+
+def _json(payload) -> Response:
+    """
+    Encode a payload once with orjson into a JSON response.
+    Used instead of jsonify on every route.
+    """
+    return Response(orjson.dumps(payload, option=ORJSON_OPTIONS), mimetype="application/json")
+
+
+# Query param specs: (name, type, default, min, max). None = unbounded.
+ITEMS_PARAMS = (
+    ("source", str, None, None, None),
+    ("min_score", int, 0, 0, None),
+    ("since", str, "", None, None),
+    ("limit", int, 50, 0, None),
+    ("offset", int, 0, 0, None),
+)
+OPPORTUNITIES_PARAMS = (
+    ("min_confidence", int, 0, 0, 100),
+    ("buyer", str, None, None, None),
+    ("market_type", str, None, None, None),
+    ("since", str, None, None, None),
+    ("limit", int, 50, 0, None),
+    ("offset", int, 0, 0, None),
+)
+MAX_PAGE_SIZE = 200  # larger limits are clamped, not rejected
+RESPONSE_CACHE_SIZE = 64  # cached responses kept, least recently used evicted
+
+
+def _parse_params(spec: tuple, args) -> tuple[dict, str | None]:
+    """Parse and range-check query params in one pass. Returns (values, error_message)."""
+    values = {}
+    for name, kind, default, low, high in spec:
+        raw = args.get(name)
+        if raw is None or kind is str:
+            values[name] = default if raw is None else raw
+            continue
+        try:
+            value = kind(raw)
+        except (ValueError, TypeError):
+            return values, f"Invalid value for '{name}': expected integer, got '{raw}'"
+        if high is not None and not (low <= value <= high):
+            return values, f"{name} must be between {low} and {high}"
+        if low is not None and value < low:
+            return values, f"{name} must be at least {low}"
+        values[name] = value
+    return values, None
+
+
+CORS_HEADERS = (
+    ("Access-Control-Allow-Origin", "*"),
+    ("Access-Control-Allow-Headers", "Content-Type"),
+    ("Access-Control-Allow-Methods", "GET, OPTIONS"),
+)
+
+# ── SQL ──
+# Constant statement text, so each pooled connection's statement cache
+# reuses the compiled program across requests. Dynamic WHERE clauses are
+# assembled in a fixed order for the same reason.
+
+DIGEST_COLUMNS = "id, digest_type, content, item_count, generated_at"
+DIGESTS_SQL = f"SELECT {DIGEST_COLUMNS} FROM digests ORDER BY generated_at DESC"
+DIGESTS_BY_TYPE_SQL = (
+    f"SELECT {DIGEST_COLUMNS} FROM digests "
+    f"WHERE digest_type = ? ORDER BY generated_at DESC"
+)
+DIGEST_BY_ID_SQL = f"SELECT {DIGEST_COLUMNS} FROM digests WHERE id = ?"
+
+OPPORTUNITY_LATEST_SQL = (
+    "SELECT o.*, r.digest_id FROM opportunities o "
+    "JOIN opportunity_runs r ON o.run_id = r.id "
+    "WHERE o.id = ? ORDER BY o.generated_at DESC LIMIT 1"
+)
+OPPORTUNITY_EVIDENCE_SQL = (
+    "SELECT source, item_title, url, score "
+    "FROM opportunity_evidence "
+    "WHERE opportunity_id = ? AND run_id = ?"
+)
+
+# Every /api/stats aggregate in one statement. Rows are tagged by kind.
+# Score buckets: MAX(score - 1, 0) / 20 maps 0-20 -> 0, 21-40 -> 1, ... 81-100 -> 4.
+STATS_SQL = """
+    SELECT 'items', NULL, COUNT(*), MAX(collected_at) FROM items
+    UNION ALL
+    SELECT 'digests', NULL, COUNT(*), NULL FROM digests
+    UNION ALL
+    SELECT 'source', source, COUNT(*), NULL FROM items GROUP BY source
+    UNION ALL
+    SELECT 'digest_type', digest_type, COUNT(*), NULL FROM digests GROUP BY digest_type
+    UNION ALL
+    SELECT 'score', MAX(score - 1, 0) / 20 AS bucket, COUNT(*), NULL
+    FROM items WHERE score BETWEEN 0 AND 100 GROUP BY bucket
+"""
+SCORE_BUCKETS = ("0-20", "21-40", "41-60", "61-80", "81-100")
+
+# Applied to every read connection. 20 MB page cache, 256 MB mmap window.
+READ_PRAGMAS = (
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA query_only=1",
+)
+
+
+class ReadConnectionPool:
+    """
+    Pool of long-lived read-only connections.
+
+    Keeps the SQLite page cache hot across requests and pays the connect +
+    PRAGMA cost once per connection instead of once per request. Connections
+    are handed to one request at a time, so sharing them across Flask's
+    worker threads is safe.
+
+    Only the idle set is capped at ``size``: a burst of more concurrent
+    requests opens extra connections rather than waiting, and those are
+    closed on release once the pool is full again.
+    """
+
+    def __init__(self, db_path: Path, size: int = 8):
+        self._db_path = db_path
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=size)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"file:{self._db_path}?mode=ro", uri=True,
+            check_same_thread=False, cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
+    def acquire(self) -> sqlite3.Connection:
+        """Check out an idle connection, or open a new one if none is free."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool. Closed if the pool is already full."""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
-def _parse_int(value: str | None, default: int, name: str) -> tuple[int, str | None]:
-    """Parse an integer query param. Returns (value, error_message)."""
-    if value is None:
-        return default, None
-    try:
-        return int(value), None
-    except (ValueError, TypeError):
-        return default, f"Invalid value for '{name}': expected integer, got '{value}'"
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
 
 
 def create_app(db_path: Path, static_folder: Path | None = None):
@@ -28,19 +209,84 @@ def create_app(db_path: Path, static_folder: Path | None = None):
     else:
         app = Flask(__name__)
 
+    app.json = OrjsonProvider(app)
+
     # ── CORS for development ──
     @app.after_request
     def add_cors(response):
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Headers"] = "Content-Type"
-        response.headers["Access-Control-Allow-Methods"] = "GET, OPTIONS"
+        response.headers.extend(CORS_HEADERS)
         return response
 
+    pool = ReadConnectionPool(db_path)
+    app.extensions["read_pool"] = pool
+
     def get_db():
-        """Open a read-only connection."""
-        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Check out a read-only connection. Return it with pool.release()."""
+        return pool.acquire()
+
+    # Storage keeps the trigram index (and its triggers) only on builds with
+    # FTS5 trigram support, so the trigger's presence is the whole check; the
+    # read-only connections could not run a CREATE VIRTUAL TABLE probe anyway.
+    # Until Storage has migrated the database, the filters fall back to LIKE.
+    fts_ready = False
+
+    def has_opportunity_fts(conn: sqlite3.Connection) -> bool:
+        nonlocal fts_ready
+        if not fts_ready:
+            fts_ready = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'opportunities_fts_insert'"
+            ).fetchone() is not None
+        return fts_ready
+
+    # ── Response cache for dashboard endpoints ──
+    # key -> (expires_at, table_version, body). Tables are append-only, so
+    # MAX(rowid) moves on every write and works as a last-write marker.
+    response_cache: OrderedDict[tuple, tuple[float, tuple, bytes]] = OrderedDict()
+    cache_lock = threading.Lock()
+    app.extensions["response_cache"] = response_cache
+
+    def cached(ttl: int, tables: tuple[str, ...], params: tuple = ()):
+        """
+        Serve cached JSON bytes until the TTL expires or a table changes.
+        Keyed on the endpoint and its parsed params (spec as for
+        _parse_params), so unknown or reordered query args share one entry.
+        """
+        version_sql = "SELECT " + ", ".join(
+            f"(SELECT MAX(rowid) FROM {t})" for t in tables
+        )
+
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                values, err = _parse_params(params, request.args)
+                if err:
+                    return fn(*args, **kwargs)
+                key = (fn.__name__, *values.values())
+
+                conn = get_db()
+                try:
+                    version = tuple(conn.execute(version_sql).fetchone())
+                finally:
+                    pool.release(conn)
+
+                now = time.monotonic()
+                with cache_lock:
+                    hit = response_cache.get(key)
+                    if hit:
+                        response_cache.move_to_end(key)
+                if hit and hit[0] > now and hit[1] == version:
+                    return Response(hit[2], mimetype="application/json")
+
+                response = fn(*args, **kwargs)
+                if response.status_code == 200:
+                    with cache_lock:
+                        response_cache[key] = (now + ttl, version, response.get_data())
+                        response_cache.move_to_end(key)
+                        if len(response_cache) > RESPONSE_CACHE_SIZE:
+                            response_cache.popitem(last=False)
+                return response
+            return wrapper
+        return decorator
 
     # ── API Routes ──
 
@@ -48,48 +294,47 @@ def create_app(db_path: Path, static_folder: Path | None = None):
     def list_digests():
         digest_type = request.args.get("type")
 
-        conn = get_db()
-        try:
-            if digest_type:
-                rows = conn.execute(
-                    "SELECT id, digest_type, content, item_count, generated_at "
-                    "FROM digests WHERE digest_type = ? ORDER BY generated_at DESC",
-                    (digest_type,),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT id, digest_type, content, item_count, generated_at "
-                    "FROM digests ORDER BY generated_at DESC"
-                ).fetchall()
-
-            digests = [
-                {
-                    "id": row["id"],
-                    "digest_type": row["digest_type"],
-                    "content": row["content"],
-                    "item_count": row["item_count"],
-                    "generated_at": row["generated_at"],
-                }
-                for row in rows
-            ]
-            return jsonify({"digests": digests})
-        finally:
-            conn.close()
+        def stream():
+            """
+            Encode rows one at a time straight off the cursor. The connection
+            is checked out on first iteration, so a body that is never read
+            (HEAD, an aborted client) never holds one.
+            """
+            conn = get_db()
+            cursor = conn.cursor()
+            try:
+                if digest_type:
+                    cursor.execute(DIGESTS_BY_TYPE_SQL, (digest_type,))
+                else:
+                    cursor.execute(DIGESTS_SQL)
+                yield b'{"digests":['
+                for i, row in enumerate(cursor):
+                    if i:
+                        yield b","
+                    yield orjson.dumps({
+                        "id": row["id"],
+                        "digest_type": row["digest_type"],
+                        "content": row["content"],
+                        "item_count": row["item_count"],
+                        "generated_at": row["generated_at"],
+                    })
+                yield b"]}"
+            finally:
+                cursor.close()
+                pool.release(conn)
+
+        return Response(stream(), mimetype="application/json")
 
     @app.route("/api/digests/<int:digest_id>")
     def get_digest(digest_id):
         conn = get_db()
         try:
-            row = conn.execute(
-                "SELECT id, digest_type, content, item_count, generated_at "
-                "FROM digests WHERE id = ?",
-                (digest_id,),
-            ).fetchone()
+            row = conn.execute(DIGEST_BY_ID_SQL, (digest_id,)).fetchone()
 
             if not row:
-                return jsonify({"error": "Digest not found"}), 404
+                return _json({"error": "Digest not found"}), 404
 
-            return jsonify({
+            return _json({
                 "id": row["id"],
                 "digest_type": row["digest_type"],
                 "content": row["content"],
@@ -97,15 +342,19 @@ def create_app(db_path: Path, static_folder: Path | None = None):
                 "generated_at": row["generated_at"],
             })
         finally:
-            conn.close()
+            pool.release(conn)
 
     @app.route("/api/items")
     def list_items():
-        source = request.args.get("source")
-        min_score = int(request.args.get("min_score", "0"))
-        since = request.args.get("since", "")
-        limit = min(int(request.args.get("limit", "50")), 200)
-        offset = int(request.args.get("offset", "0"))
+        args, err = _parse_params(ITEMS_PARAMS, request.args)
+        if err:
+            return _json({"error": err}), 400
+
+        source = args["source"]
+        min_score = args["min_score"]
+        since = args["since"]
+        limit = min(args["limit"], MAX_PAGE_SIZE)
+        offset = args["offset"]
 
         conn = get_db()
         try:
@@ -130,7 +379,8 @@ def create_app(db_path: Path, static_folder: Path | None = None):
 
             # Get items
             rows = conn.execute(
-                f"SELECT content_hash, source, source_id, url, title, body, "
+                f"SELECT content_hash, source, source_id, url, title, "
+                f"substr(body, 1, 500) AS body, "  # Truncate for list view
                 f"metadata, score, collected_at "
                 f"FROM items WHERE {where} "
                 f"ORDER BY score DESC, collected_at DESC "
@@ -146,63 +396,47 @@ def create_app(db_path: Path, static_folder: Path | None = None):
                     "source_id": row["source_id"],
                     "url": row["url"],
                     "title": row["title"],
-                    "body": row["body"][:500],  # Truncate for list view
-                    "metadata": json.loads(row["metadata"]),
+                    "body": row["body"],
+                    # Stored as JSON text; splice it into the response verbatim
+                    "metadata": orjson.Fragment(row["metadata"]),
                     "score": row["score"],
                     "collected_at": row["collected_at"],
                 })
 
-            return jsonify({
+            return _json({
                 "items": items,
                 "total": total,
                 "limit": limit,
                 "offset": offset,
             })
         finally:
-            conn.close()
+            pool.release(conn)
 
     @app.route("/api/stats")
+    @cached(ttl=60, tables=("items", "digests"))
     def get_stats():
         conn = get_db()
         try:
-            total_items = conn.execute("SELECT COUNT(*) as cnt FROM items").fetchone()["cnt"]
-            total_digests = conn.execute("SELECT COUNT(*) as cnt FROM digests").fetchone()["cnt"]
-
+            total_items = total_digests = 0
+            latest_collection = None
             by_source = {}
-            for row in conn.execute(
-                "SELECT source, COUNT(*) as cnt FROM items GROUP BY source"
-            ):
-                by_source[row["source"]] = row["cnt"]
-
             by_digest_type = {}
-            for row in conn.execute(
-                "SELECT digest_type, COUNT(*) as cnt FROM digests GROUP BY digest_type"
-            ):
-                by_digest_type[row["digest_type"]] = row["cnt"]
-
-            latest_row = conn.execute(
-                "SELECT MAX(collected_at) as latest FROM items"
-            ).fetchone()
-            latest_collection = latest_row["latest"] if latest_row["latest"] else None
-
-            # Score distribution
             score_dist = {}
-            for row in conn.execute("""
-                SELECT
-                    CASE
-                        WHEN score BETWEEN 0 AND 20 THEN '0-20'
-                        WHEN score BETWEEN 21 AND 40 THEN '21-40'
-                        WHEN score BETWEEN 41 AND 60 THEN '41-60'
-                        WHEN score BETWEEN 61 AND 80 THEN '61-80'
-                        WHEN score BETWEEN 81 AND 100 THEN '81-100'
-                    END as bucket,
-                    COUNT(*) as cnt
-                FROM items GROUP BY bucket
-            """):
-                if row["bucket"]:
-                    score_dist[row["bucket"]] = row["cnt"]
-
-            return jsonify({
+
+            for kind, key, cnt, latest in conn.execute(STATS_SQL):
+                if kind == "items":
+                    total_items = cnt
+                    latest_collection = latest or None
+                elif kind == "digests":
+                    total_digests = cnt
+                elif kind == "source":
+                    by_source[key] = cnt
+                elif kind == "digest_type":
+                    by_digest_type[key] = cnt
+                else:
+                    score_dist[SCORE_BUCKETS[key]] = cnt
+
+            return _json({
                 "total_items": total_items,
                 "total_digests": total_digests,
                 "by_source": by_source,
@@ -211,46 +445,36 @@ def create_app(db_path: Path, static_folder: Path | None = None):
                 "score_distribution": score_dist,
             })
         finally:
-            conn.close()
+            pool.release(conn)
 
     # ── Opportunity Routes ──
 
     @app.route("/api/opportunities")
     def list_opportunities():
         """List structured opportunities with filters."""
-        # Validate integer params
-        min_confidence, err = _parse_int(request.args.get("min_confidence"), 0, "min_confidence")
-        if err:
-            return jsonify({"error": err}), 400
-
-        limit_raw, err = _parse_int(request.args.get("limit"), 50, "limit")
-        if err:
-            return jsonify({"error": err}), 400
-        limit = min(limit_raw, 200)
-
-        offset, err = _parse_int(request.args.get("offset"), 0, "offset")
+        args, err = _parse_params(OPPORTUNITIES_PARAMS, request.args)
         if err:
-            return jsonify({"error": err}), 400
-
-        # Validate min_confidence range
-        if not (0 <= min_confidence <= 100):
-            return jsonify({"error": "min_confidence must be between 0 and 100"}), 400
+            return _json({"error": err}), 400
 
-        buyer = request.args.get("buyer")
-        market_type = request.args.get("market_type")
-        since = request.args.get("since")
+        min_confidence = args["min_confidence"]
+        buyer = args["buyer"]
+        market_type = args["market_type"]
+        since = args["since"]
+        limit = min(args["limit"], MAX_PAGE_SIZE)
+        offset = args["offset"]
 
         conn = get_db()
         try:
             conditions = ["o.confidence >= ?"]
             params: list = [min_confidence]
 
-            if buyer:
-                conditions.append("LOWER(o.target_buyer) LIKE ?")
-                params.append(f"%{buyer.lower()}%")
-            if market_type:
-                conditions.append("LOWER(o.market_type) LIKE ?")
-                params.append(f"%{market_type.lower()}%")
+            for column, value in (("target_buyer", buyer), ("market_type", market_type)):
+                if value:
+                    condition, param = opportunity_text_filter(
+                        column, value, indexed=has_opportunity_fts(conn),
+                    )
+                    conditions.append(condition)
+                    params.append(param)
             if since:
                 conditions.append("o.generated_at >= ?")
                 params.append(since)
@@ -270,15 +494,27 @@ def create_app(db_path: Path, static_folder: Path | None = None):
                 params + [limit, offset],
             ).fetchall()
 
+            # All evidence for the page in one query, bucketed by (id, run_id)
+            evidence: dict[tuple[str, int], list[dict]] = defaultdict(list)
+            if rows:
+                keys = [(row["id"], row["run_id"]) for row in rows]
+                values = ", ".join("(?, ?)" for _ in keys)
+                for ev in conn.execute(
+                    f"SELECT opportunity_id, run_id, source, item_title, url, score "
+                    f"FROM opportunity_evidence "
+                    f"WHERE (opportunity_id, run_id) IN (VALUES {values}) "
+                    f"ORDER BY id",
+                    [v for key in keys for v in key],
+                ):
+                    evidence[(ev["opportunity_id"], ev["run_id"])].append({
+                        "source": ev["source"],
+                        "item_title": ev["item_title"],
+                        "url": ev["url"],
+                        "score": ev["score"],
+                    })
+
             results = []
             for row in rows:
-                ev_rows = conn.execute(
-                    "SELECT source, item_title, url, score "
-                    "FROM opportunity_evidence "
-                    "WHERE opportunity_id = ? AND run_id = ?",
-                    (row["id"], row["run_id"]),
-                ).fetchall()
-
                 results.append({
                     "id": row["id"],
                     "run_id": row["run_id"],
@@ -294,80 +530,54 @@ def create_app(db_path: Path, static_folder: Path | None = None):
                     "competition_notes": row["competition_notes"],
                     "generated_at": row["generated_at"],
                     "digest_id": row["digest_id"],
-                    "evidence": [
-                        {
-                            "source": ev["source"],
-                            "item_title": ev["item_title"],
-                            "url": ev["url"],
-                            "score": ev["score"],
-                        }
-                        for ev in ev_rows
-                    ],
+                    "evidence": evidence[(row["id"], row["run_id"])],
                 })
 
-            return jsonify({
+            return _json({
                 "opportunities": results,
                 "total": total,
                 "limit": limit,
                 "offset": offset,
             })
         finally:
-            conn.close()
+            pool.release(conn)
 
     @app.route("/api/opportunities/trends")
+    @cached(ttl=60, tables=("opportunities",))
     def opportunity_trends():
         """Get confidence trends for opportunities across runs."""
         conn = get_db()
         try:
-            rows = conn.execute(
-                "SELECT o.id, o.title, o.run_id, o.confidence, o.generated_at "
-                "FROM opportunities o "
-                "ORDER BY o.id, o.generated_at ASC"
-            ).fetchall()
-
-            trends: dict[str, dict] = {}
-            for row in rows:
-                oid = row["id"]
-                if oid not in trends:
-                    trends[oid] = {
-                        "id": oid,
-                        "title": row["title"],
-                        "data_points": [],
-                    }
-                trends[oid]["data_points"].append({
-                    "run_id": row["run_id"],
-                    "confidence": row["confidence"],
-                    "generated_at": row["generated_at"],
-                })
-                trends[oid]["title"] = row["title"]
-
-            return jsonify({"trends": list(trends.values())})
+            trends = [
+                {
+                    "id": row["id"],
+                    "title": row["title"],
+                    "data_points": (
+                        orjson.Fragment(row["data_points"]) if ORDERED_AGGREGATES
+                        else sorted_trend_points(row["data_points"])
+                    ),
+                }
+                for row in conn.execute(OPPORTUNITY_TRENDS_SQL)
+            ]
+            return _json({"trends": trends})
         finally:
-            conn.close()
+            pool.release(conn)
 
     @app.route("/api/opportunities/<opportunity_id>")
     def get_opportunity(opportunity_id):
         """Get the latest version of an opportunity by slug."""
         conn = get_db()
         try:
-            row = conn.execute(
-                "SELECT o.*, r.digest_id FROM opportunities o "
-                "JOIN opportunity_runs r ON o.run_id = r.id "
-                "WHERE o.id = ? ORDER BY o.generated_at DESC LIMIT 1",
-                (opportunity_id,),
-            ).fetchone()
+            row = conn.execute(OPPORTUNITY_LATEST_SQL, (opportunity_id,)).fetchone()
 
             if not row:
-                return jsonify({"error": "Opportunity not found"}), 404
+                return _json({"error": "Opportunity not found"}), 404
 
             ev_rows = conn.execute(
-                "SELECT source, item_title, url, score "
-                "FROM opportunity_evidence "
-                "WHERE opportunity_id = ? AND run_id = ?",
-                (row["id"], row["run_id"]),
+                OPPORTUNITY_EVIDENCE_SQL, (row["id"], row["run_id"])
             ).fetchall()
 
-            return jsonify({
+            return _json({
                 "id": row["id"],
                 "run_id": row["run_id"],
                 "title": row["title"],
@@ -393,7 +603,7 @@ def create_app(db_path: Path, static_folder: Path | None = None):
                 ],
             })
         finally:
-            conn.close()
+            pool.release(conn)
 
     # ── Static file serving (production) ──
 
@@ -401,7 +611,7 @@ def create_app(db_path: Path, static_folder: Path | None = None):
     def serve_index():
         if static_folder and static_folder.exists():
             return send_from_directory(str(static_folder), "index.html")
-        return jsonify({
+        return _json({
             "message": "signal-extract API",
             "endpoints": [
                 "/api/digests",
@@ -422,6 +632,6 @@ def create_app(db_path: Path, static_folder: Path | None = None):
             if file_path.exists():
                 return send_from_directory(str(static_folder), path)
             return send_from_directory(str(static_folder), "index.html")
-        return jsonify({"error": "Not found"}), 404
+        return _json({"error": "Not found"}), 404
 
     return app
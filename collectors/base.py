@@ -4,9 +4,40 @@ Base collector interface. All collectors must implement this.
 
 from abc import ABC, abstractmethod
 
-from models import Item
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from models import Item, Source
+from storage.bloom import BloomFilter
 from storage.db import Storage
 
+USER_AGENT = "signal-extract/0.1"
+
+
+def make_session() -> requests.Session:
+    """
+    HTTP session shared by a collector's worker threads: a connection pool
+    large enough for them, plus backoff retries on rate limits and transient
+    5xx. After the last retry the response is returned as-is, so callers keep
+    handling status codes themselves.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class Collector(ABC):
     """
@@ -14,13 +45,38 @@ class Collector(ABC):
 
     Contract:
     - collect() is idempotent. Calling it twice yields no duplicates.
-    - Collectors manage their own cursors via Storage.
+    - Collectors manage their own cursors via Storage. State that would skip
+      refetching this run's items can be staged and written in commit(),
+      which the caller runs only once those items are stored.
     - Collectors never call LLMs. All logic is deterministic.
     - Collectors yield raw Items with score=0 (filters score later).
     """
 
     def __init__(self, storage: Storage):
         self.storage = storage
+        self._known: BloomFilter | None = None
+
+    def _load_known(self, source: Source):
+        """Prime an in-memory Bloom filter with the hashes already stored for source."""
+        self._known = self.storage.hash_filter(source)
+
+    def _stored_hashes(self, content_hashes: list[str]) -> set[str]:
+        """
+        The subset of content_hashes already stored. A Bloom filter miss means
+        new — no query. Only probable hits (or everything, if no filter was
+        loaded) go to SQLite, in one batched lookup.
+        """
+        known = self._known
+        maybe = [h for h in content_hashes if known is None or h in known]
+        return self.storage.existing_hashes(maybe) if maybe else set()
+
+    def _drop_stored(self, candidates: list[Item]) -> list[Item]:
+        """Dedup a batch of items against storage."""
+        existing = self._stored_hashes([item.content_hash for item in candidates])
+        return [item for item in candidates if item.content_hash not in existing]
+
+    def commit(self):
+        """Persist state staged by the last collect(). No-op unless overridden."""
 
     @abstractmethod
     def collect(self) -> list[Item]:
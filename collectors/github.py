@@ -5,80 +5,155 @@ Uses the GitHub REST API. No GraphQL — simpler, sufficient for this use case.
 """
 
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+import orjson
 import requests
 
-from collectors.base import Collector
+from collectors.base import Collector, make_session
 from config.settings import Config
 from models import Item, Source
 from storage.db import Storage
 
 log = logging.getLogger(__name__)
 
+# Per-request override that strips the session's Authorization header.
+# Requests drops headers whose value is None when merging.
+_NO_AUTH = {"Authorization": None}
+
 
 class GitHubCollector(Collector):
     def __init__(self, storage: Storage, config: Config):
         super().__init__(storage)
         self._repos = config.github_repos
-        self._session = requests.Session()
+        self._session = make_session()
         self._token = config.github_token
         if self._token and not self._token.startswith(("ghp_...", "your")):
             self._session.headers["Authorization"] = f"token {self._token}"
         self._session.headers["Accept"] = "application/vnd.github.v3+json"
-        self._session.headers["User-Agent"] = "signal-extract/0.1"
         self._auth_failed = False
+        # url -> [etag, last_modified], persisted in collector state
+        self._validators: dict[str, list[str]] = {}
+        self._validators_lock = threading.Lock()
+        self._staged_state: dict | None = None
 
     def name(self) -> str:
         return "github"
 
     def _request(self, url: str, params: dict | None = None) -> requests.Response | None:
-        """Make a GitHub API request. Falls back to unauthenticated on 401."""
-        resp = self._session.get(url, params=params, timeout=15)
+        """
+        Make a GitHub API request. Falls back to unauthenticated on 401.
+
+        Sends the ETag / Last-Modified seen for this URL last run. A 304 means
+        nothing changed and returns None, like any other non-200 — GitHub
+        does not count 304s against the rate limit.
 
-        if resp.status_code == 401 and "Authorization" in self._session.headers:
+        Safe to call from worker threads: the shared session is never mutated.
+        """
+        headers = self._conditional_headers(url)
+        authed = not self._auth_failed
+        if not authed:
+            headers.update(_NO_AUTH)
+        resp = self._session.get(url, params=params, headers=headers, timeout=15)
+
+        if (
+            resp.status_code == 401
+            and authed
+            and "Authorization" in self._session.headers
+        ):
             if not self._auth_failed:
                 log.warning("GitHub token rejected (401). Falling back to unauthenticated.")
                 self._auth_failed = True
-                del self._session.headers["Authorization"]
-            resp = self._session.get(url, params=params, timeout=15)
+            headers.update(_NO_AUTH)
+            resp = self._session.get(url, params=params, headers=headers, timeout=15)
+
+        if resp.status_code == 304:
+            log.debug(f"GitHub API {url}: not modified")
+            return None
 
         if resp.status_code != 200:
             log.warning(f"GitHub API {url}: HTTP {resp.status_code}")
             return None
 
+        etag = resp.headers.get("ETag", "")
+        last_modified = resp.headers.get("Last-Modified", "")
+        if etag or last_modified:
+            with self._validators_lock:
+                self._validators[url] = [etag, last_modified]
+
         return resp
 
+    def _conditional_headers(self, url: str) -> dict:
+        """If-None-Match / If-Modified-Since headers for a previously seen URL."""
+        with self._validators_lock:
+            etag, last_modified = self._validators.get(url, ("", ""))
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
     def collect(self) -> list[Item]:
         state = self.storage.get_collector_state(self.name())
         items: list[Item] = []
-
-        for repo in self._repos:
-            try:
-                items.extend(self._collect_releases(repo, state))
-                items.extend(self._collect_issues(repo, state))
-            except requests.RequestException as e:
-                log.warning(f"GitHub API error for {repo}: {e}")
-                continue
-
-        # Update state with current timestamp
+        if not self._repos:
+            return items
+        self._validators = dict(state.get("http_validators", {}))
+
+        # Fetch releases and issues for every repo concurrently. Workers only
+        # do HTTP + parsing; dedup against storage and all state updates
+        # happen here, in repo order, so the state dict has a single writer.
+        with ThreadPoolExecutor(max_workers=min(16, 2 * len(self._repos))) as pool:
+            futures = [
+                (
+                    repo,
+                    pool.submit(self._collect_releases, repo, state),
+                    pool.submit(self._collect_issues, repo, state),
+                )
+                for repo in self._repos
+            ]
+            for repo, releases_future, issues_future in futures:
+                try:
+                    releases, _ = self._partition_stored(releases_future.result())
+                    self._remember(state, f"releases_seen_{repo}", releases)
+                    items.extend(releases)
+
+                    issues, stored = self._partition_stored(issues_future.result())
+                    self._remember(state, f"issues_stored_{repo}", stored)
+                    items.extend(issues)
+                except (requests.RequestException, orjson.JSONDecodeError) as e:
+                    log.warning(f"GitHub API error for {repo}: {e}")
+                    continue
+
+        # Staged, not saved: with fresh validators the next run gets a 304 for
+        # these URLs, so they are written only once the items are stored
+        state["http_validators"] = self._validators
         state["last_collected"] = datetime.now(timezone.utc).isoformat()
-        self.storage.set_collector_state(self.name(), state)
+        self._staged_state = state
 
         return items
 
+    def commit(self):
+        """Save the state staged by collect(), once its items are stored."""
+        if self._staged_state is not None:
+            self.storage.set_collector_state(self.name(), self._staged_state)
+            self._staged_state = None
+
     def _collect_releases(self, repo: str, state: dict) -> list[Item]:
-        """Fetch recent releases. Only return ones we haven't seen."""
+        """Fetch recent releases. Only return ones not in the seen state."""
         url = f"https://api.github.com/repos/{repo}/releases"
         resp = self._request(url, params={"per_page": 5})
         if resp is None:
             return []
 
         items = []
-        seen_key = f"releases_seen_{repo}"
-        seen = set(state.get(seen_key, []))
+        seen = set(state.get(f"releases_seen_{repo}", []))
 
-        for release in resp.json():
+        for release in orjson.loads(resp.content):
             tag = release.get("tag_name", "")
             release_id = f"{repo}:{tag}"
 
@@ -103,14 +178,30 @@ class GitHubCollector(Collector):
                     "created_at": release.get("created_at", ""),
                 },
             )
+            items.append(item)
 
-            if not self.storage.has_item(item.content_hash):
-                items.append(item)
-                seen.add(release_id)
-
-        state[seen_key] = list(seen)[-50:]  # keep last 50 to bound state size
         return items
 
+    def _partition_stored(self, candidates: list[Item]) -> tuple[list[Item], list[Item]]:
+        """Split candidates into (new, already stored). One query for the whole batch."""
+        existing = self.storage.existing_hashes([item.content_hash for item in candidates])
+        new = [item for item in candidates if item.content_hash not in existing]
+        stored = [item for item in candidates if item.content_hash in existing]
+        return new, stored
+
+    def _remember(self, state: dict, seen_key: str, items: list[Item], limit: int = 50):
+        """
+        Record item source ids in collector state.
+        Persisted oldest-first and capped at the `limit` most recent to bound state size.
+        """
+        recent = deque(state.get(seen_key, []), maxlen=limit)
+        seen = set(recent)
+        for item in items:
+            if item.source_id not in seen:
+                recent.append(item.source_id)
+                seen.add(item.source_id)
+        state[seen_key] = list(recent)
+
     def _collect_issues(self, repo: str, state: dict) -> list[Item]:
         """
         Fetch recently updated issues with high engagement.
@@ -128,19 +219,26 @@ class GitHubCollector(Collector):
         if resp is None:
             return []
 
+        # Issues confirmed stored on a previous run. Storage is append-only,
+        # so these can be skipped without building an Item or querying.
+        stored = set(state.get(f"issues_stored_{repo}", []))
+
         items = []
-        for issue in resp.json():
+        for issue in orjson.loads(resp.content):
             # Skip pull requests (GitHub API returns them as issues)
             if "pull_request" in issue:
                 continue
 
+            issue_id = f"{repo}:issue:{issue['number']}"
+            if issue_id in stored:
+                continue
+
             # Only care about issues with meaningful engagement
             reactions = issue.get("reactions", {}).get("total_count", 0)
             comments = issue.get("comments", 0)
             if reactions < 5 and comments < 3:
                 continue
 
-            issue_id = f"{repo}:issue:{issue['number']}"
             body = issue.get("body", "") or ""
             if len(body) > 2000:
                 body = body[:2000] + "\n[truncated]"
@@ -162,8 +260,6 @@ class GitHubCollector(Collector):
                     "labels": labels,
                 },
             )
-
-            if not self.storage.has_item(item.content_hash):
-                items.append(item)
+            items.append(item)
 
         return items
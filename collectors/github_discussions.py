@@ -9,11 +9,13 @@ Requires GITHUB_TOKEN with read:discussion scope.
 """
 
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-import requests
+import orjson
 
-from collectors.base import Collector
+from collectors.base import Collector, make_session
 from config.settings import Config
 from models import Item, Source
 from storage.db import Storage
@@ -73,8 +75,7 @@ class GitHubDiscussionsCollector(Collector):
         super().__init__(storage)
         self._repos = config.github_discussions_repos
         self._token = config.github_token
-        self._session = requests.Session()
-        self._session.headers["User-Agent"] = "signal-extract/0.1"
+        self._session = make_session()
         if self._token and not self._token.startswith(("ghp_...", "your")):
             self._session.headers["Authorization"] = f"bearer {self._token}"
         self._session.headers["Content-Type"] = "application/json"
@@ -89,19 +90,51 @@ class GitHubDiscussionsCollector(Collector):
             )
             return []
 
+        state = self.storage.get_collector_state(self.name())
         items: list[Item] = []
-        for repo in self._repos:
-            try:
-                new_items = self._collect_repo(repo)
-                items.extend(new_items)
-            except Exception as e:
-                log.warning(f"Discussions error for {repo}: {e}")
-                continue
-
+        if not self._repos:
+            return items
+
+        # One GraphQL POST per repo, all in flight at once. Dedup against
+        # storage and state updates stay on this thread, so the state dict
+        # has a single writer.
+        with ThreadPoolExecutor(max_workers=min(8, len(self._repos))) as pool:
+            futures = [
+                (repo, pool.submit(self._collect_repo, repo, state))
+                for repo in self._repos
+            ]
+            for repo, future in futures:
+                try:
+                    candidates = future.result()
+                except Exception as e:
+                    log.warning(f"Discussions error for {repo}: {e}")
+                    continue
+
+                existing = self.storage.existing_hashes(
+                    [item.content_hash for item in candidates]
+                )
+                self._remember_stored(
+                    state, repo,
+                    [item for item in candidates if item.content_hash in existing],
+                )
+                items.extend(item for item in candidates if item.content_hash not in existing)
+
+        self.storage.set_collector_state(self.name(), state)
         return items
 
-    def _collect_repo(self, repo: str) -> list[Item]:
-        """Fetch recent discussions from one repo via GraphQL."""
+    def _remember_stored(self, state: dict, repo: str, stored: list[Item]):
+        """Record discussions confirmed stored. Last 100 per repo, oldest-first."""
+        key = f"stored_{repo}"
+        recent = deque(state.get(key, []), maxlen=100)
+        seen = set(recent)
+        for item in stored:
+            if item.source_id not in seen:
+                recent.append(item.source_id)
+                seen.add(item.source_id)
+        state[key] = list(recent)
+
+    def _collect_repo(self, repo: str, state: dict) -> list[Item]:
+        """Fetch recent discussions from one repo via GraphQL. Does not touch storage."""
         parts = repo.split("/")
         if len(parts) != 2:
             log.warning(f"Invalid repo format for discussions: {repo}")
@@ -125,7 +158,7 @@ class GitHubDiscussionsCollector(Collector):
             log.warning(f"GraphQL HTTP {resp.status_code} for {repo}")
             return []
 
-        data = resp.json()
+        data = orjson.loads(resp.content)
         if "errors" in data:
             msgs = [e.get("message", "") for e in data["errors"]]
             log.warning(f"GraphQL errors for {repo}: {msgs}")
@@ -137,6 +170,8 @@ class GitHubDiscussionsCollector(Collector):
             return []
 
         nodes = repository.get("discussions", {}).get("nodes", [])
+        # Confirmed stored on a previous run; storage is append-only
+        stored = set(state.get(f"stored_{repo}", []))
         items = []
 
         for disc in nodes:
@@ -152,6 +187,8 @@ class GitHubDiscussionsCollector(Collector):
 
             disc_number = disc.get("number", 0)
             disc_id = f"{repo}:discussion:{disc_number}"
+            if disc_id in stored:
+                continue
 
             body = disc.get("body", "") or ""
             if len(body) > 3000:
@@ -169,9 +206,8 @@ class GitHubDiscussionsCollector(Collector):
             created_at_str = disc.get("createdAt", "")
             if created_at_str:
                 try:
-                    collected_at = datetime.fromisoformat(
-                        created_at_str.replace("Z", "+00:00")
-                    )
+                    # Python 3.11+ parses the trailing "Z" natively
+                    collected_at = datetime.fromisoformat(created_at_str)
                 except (ValueError, TypeError):
                     pass
 
@@ -194,8 +230,6 @@ class GitHubDiscussionsCollector(Collector):
                 },
                 collected_at=collected_at,
             )
-
-            if not self.storage.has_item(item.content_hash):
-                items.append(item)
+            items.append(item)
 
         return items
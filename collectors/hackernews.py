@@ -9,11 +9,13 @@ Strategy:
 """
 
 import logging
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
+import orjson
 import requests
 
-from collectors.base import Collector
+from collectors.base import Collector, make_session
 from config.settings import Config
 from models import Item, Source
 from storage.db import Storage
@@ -23,6 +25,9 @@ log = logging.getLogger(__name__)
 HN_API = "https://hacker-news.firebaseio.com/v0"
 HN_SEARCH_API = "https://hn.algolia.com/api/v1/search_by_date"
 
+# Concurrent requests per collect() phase. Every call is an independent GET.
+MAX_WORKERS = 8
+
 
 class HackerNewsCollector(Collector):
     def __init__(self, storage: Storage, config: Config):
@@ -31,33 +36,41 @@ class HackerNewsCollector(Collector):
         self._max_items = config.hn_max_items
         self._search_keywords = config.hn_search_keywords
         self._search_min_score = config.hn_search_min_score
-        self._session = requests.Session()
-        self._session.headers["User-Agent"] = "signal-extract/0.1"
+        self._session = make_session()
 
     def name(self) -> str:
         return "hackernews"
 
     def collect(self) -> list[Item]:
-        items: list[Item] = []
+        self._load_known(Source.HACKER_NEWS)
+        batches: list[list[Item]] = []
 
         # Broad: top stories
         try:
-            items.extend(self._collect_top_stories())
-        except requests.RequestException as e:
+            batches.append(self._collect_top_stories())
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             log.warning(f"HN top stories error: {e}")
 
-        # Targeted: keyword search via Algolia
-        seen_ids = {item.source_id for item in items}
-        for keyword in self._search_keywords:
-            try:
-                for item in self._search_stories(keyword):
-                    if item.source_id not in seen_ids:
-                        items.append(item)
-                        seen_ids.add(item.source_id)
-            except requests.RequestException as e:
-                log.warning(f"HN search error for '{keyword}': {e}")
-
-        return items
+        # Targeted: keyword search via Algolia, all keywords in flight at once
+        if self._search_keywords:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                futures = [
+                    (keyword, pool.submit(self._search_stories, keyword))
+                    for keyword in self._search_keywords
+                ]
+                for keyword, future in futures:
+                    try:
+                        batches.append(future.result())
+                    except (requests.RequestException, orjson.JSONDecodeError) as e:
+                        log.warning(f"HN search error for '{keyword}': {e}")
+
+        # A story can surface in top stories and several searches; the first
+        # occurrence wins (dicts keep insertion order).
+        unique: dict[str, Item] = {}
+        for item in chain.from_iterable(batches):
+            unique.setdefault(item.source_id, item)
+
+        return self._drop_stored(list(unique.values()))
 
     def _collect_top_stories(self) -> list[Item]:
         """Fetch top stories, filter by score threshold."""
@@ -65,16 +78,21 @@ class HackerNewsCollector(Collector):
         if resp.status_code != 200:
             return []
 
-        story_ids = resp.json()[:self._max_items]
+        story_ids = orjson.loads(resp.content)[:self._max_items]
         items = []
-
-        for story_id in story_ids:
-            try:
-                item = self._fetch_story(story_id)
-                if item:
-                    items.append(item)
-            except requests.RequestException:
-                continue
+        if not story_ids:
+            return items
+
+        # Story fetches are independent round-trips; keep ranking order.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = [pool.submit(self._fetch_story, story_id) for story_id in story_ids]
+            for future in futures:
+                try:
+                    item = future.result()
+                    if item:
+                        items.append(item)
+                except (requests.RequestException, orjson.JSONDecodeError):
+                    continue
 
         return items
 
@@ -84,7 +102,7 @@ class HackerNewsCollector(Collector):
         if resp.status_code != 200:
             return None
 
-        story = resp.json()
+        story = orjson.loads(resp.content)
         if not story or story.get("type") != "story":
             return None
 
@@ -109,9 +127,6 @@ class HackerNewsCollector(Collector):
             },
         )
 
-        if self.storage.has_item(item.content_hash):
-            return None
-
         return item
 
     def _search_stories(self, keyword: str) -> list[Item]:
@@ -134,7 +149,7 @@ class HackerNewsCollector(Collector):
             log.warning(f"HN search API HTTP {resp.status_code} for '{keyword}'")
             return []
 
-        hits = resp.json().get("hits", [])
+        hits = orjson.loads(resp.content).get("hits", [])
         items = []
 
         for hit in hits:
@@ -143,16 +158,6 @@ class HackerNewsCollector(Collector):
                 continue
 
             hn_id = f"hn:{object_id}"
-
-            # Check dedup before building full item
-            check_item = Item(
-                source=Source.HACKER_NEWS,
-                source_id=hn_id,
-                url="", title="", body="",
-            )
-            if self.storage.has_item(check_item.content_hash):
-                continue
-
             story_url = hit.get("url") or f"https://news.ycombinator.com/item?id={object_id}"
             story_text = hit.get("story_text") or ""
             if len(story_text) > 3000:
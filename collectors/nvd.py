@@ -9,34 +9,62 @@ No API key required (5 requests/30 seconds). Optional key for higher limits.
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 
+import orjson
 import requests
 
-from collectors.base import Collector
+from collectors.base import Collector, make_session
 from config.settings import Config
-from models import Item, Source
+from models import Item, Source, content_hash_for
 from storage.db import Storage
 
 log = logging.getLogger(__name__)
 
 
+def _affected_products(configurations: list, limit: int = 10) -> list[str]:
+    """
+    vendor:product pairs from CPE match criteria (simplified). Stops walking
+    the configuration tree once limit pairs are found.
+    """
+    products = []
+    for config_node in configurations:
+        for node in config_node.get("nodes", []):
+            for cpe_match in node.get("cpeMatch", []):
+                criteria = cpe_match.get("criteria", "")
+                if criteria:
+                    # cpe:2.3:part:vendor:product:... — only split what we need
+                    parts = criteria.split(":", 5)
+                    if len(parts) >= 5:
+                        products.append(f"{parts[3]}:{parts[4]}")
+                        if len(products) >= limit:
+                            return products
+    return products
+
+
 class NVDCollector(Collector):
     NVD_API = "https://services.nvd.nist.gov/rest/json/cves/2.0"
+    NVD_DETAIL_URL = "https://nvd.nist.gov/vuln/detail/"
 
     def __init__(self, storage: Storage, config: Config):
         super().__init__(storage)
         self._config = config
-        self._session = requests.Session()
-        self._session.headers["User-Agent"] = "signal-extract/0.1"
+        self._session = make_session()
         if config.nvd_api_key:
             self._session.headers["apiKey"] = config.nvd_api_key
+        # 5 requests / 30s without a key, 50 / 30s with one
+        self._request_interval = 0.6 if config.nvd_api_key else 6.0
+        self._next_request_at = 0.0
+        self._throttle_lock = threading.Lock()
 
     def name(self) -> str:
         return "nvd"
 
     def collect(self) -> list[Item]:
+        self._load_known(Source.NVD_CVE)
         state = self.storage.get_collector_state(self.name())
         last_modified = state.get("last_modified", "")
 
@@ -59,79 +87,119 @@ class NVDCollector(Collector):
 
         return items
 
+    def _throttle(self):
+        """Space requests to stay inside NVD's rolling 30-second rate limit."""
+        with self._throttle_lock:
+            wait = self._next_request_at - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next_request_at = time.monotonic() + self._request_interval
+
+    def _fetch_page(self, params: dict, start_index: int, per_page: int) -> dict:
+        self._throttle()
+        resp = self._session.get(
+            self.NVD_API,
+            params={**params, "startIndex": start_index, "resultsPerPage": per_page},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
     def _fetch_cves(self, start_date: str, end_date: str) -> list[Item]:
-        """Fetch CVEs modified within the date range."""
+        """
+        Fetch CVEs modified within the date range, up to nvd_max_results.
+        The next page is requested in the background while the current one
+        is parsed and deduped.
+        """
+        max_results = self._config.nvd_max_results
+        page_size = min(max_results, 50)
         params = {
             "lastModStartDate": start_date,
             "lastModEndDate": end_date,
-            "resultsPerPage": min(self._config.nvd_max_results, 50),
         }
 
-        try:
-            resp = self._session.get(self.NVD_API, params=params, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-        except requests.RequestException as e:
-            log.error(f"NVD API request failed: {e}")
-            return []
+        items: list[Item] = []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            start_index = 0
+            future = pool.submit(self._fetch_page, params, start_index, page_size)
+            while future is not None:
+                try:
+                    data = future.result()
+                except (requests.RequestException, orjson.JSONDecodeError) as e:
+                    log.error(f"NVD API request failed: {e}")
+                    break
+
+                start_index += page_size
+                total = min(data.get("totalResults", 0), max_results)
+                future = (
+                    pool.submit(
+                        self._fetch_page, params, start_index,
+                        min(page_size, total - start_index),
+                    )
+                    if start_index < total else None
+                )
+                items.extend(self._parse_page(data.get("vulnerabilities", [])))
+
+        return items
 
-        vulnerabilities = data.get("vulnerabilities", [])
+    def _parse_page(self, vulnerabilities: list) -> list[Item]:
+        """New, above-threshold Items from one page of results."""
         log.info(f"NVD returned {len(vulnerabilities)} CVEs")
 
-        items = []
+        # Cheap phase: dedup keys only. Skip already-collected CVEs (one
+        # lookup for the whole page) before any of them is fully parsed.
+        keyed = []
         for vuln in vulnerabilities:
             cve = vuln.get("cve", {})
+            if cve.get("id"):
+                keyed.append((cve, content_hash_for(Source.NVD_CVE, f"nvd:{cve['id']}")))
+        stored = self._stored_hashes([content_hash for _, content_hash in keyed])
+
+        items = []
+        for cve, content_hash in keyed:
+            if content_hash in stored:
+                continue
             item = self._parse_cve(cve)
             if item:
-                # Skip if below CVSS threshold
-                cvss = item.metadata.get("cvss_score", 0)
-                if cvss < self._config.nvd_min_cvss:
-                    continue
-
-                # Skip if already collected
-                if self.storage.has_item(item.content_hash):
-                    continue
-
                 items.append(item)
 
         return items
 
     def _parse_cve(self, cve: dict) -> Item | None:
-        """Parse a CVE entry into an Item."""
+        """Parse a CVE entry into an Item. None if unparseable or below the CVSS threshold."""
         cve_id = cve.get("id", "")
         if not cve_id:
             return None
 
-        # Get English description
-        descriptions = cve.get("descriptions", [])
-        description = ""
-        for desc in descriptions:
-            if desc.get("lang") == "en":
-                description = desc.get("value", "")
-                break
-        if not description and descriptions:
-            description = descriptions[0].get("value", "")
-
         # Extract CVSS score (prefer v3.1, fall back to v3.0, then v2.0)
         cvss_score = 0.0
         severity = "UNKNOWN"
         metrics = cve.get("metrics", {})
 
-        for metric_key in ["cvssMetricV31", "cvssMetricV30"]:
-            metric_list = metrics.get(metric_key, [])
-            if metric_list:
-                cvss_data = metric_list[0].get("cvssData", {})
-                cvss_score = cvss_data.get("baseScore", 0.0)
-                severity = cvss_data.get("baseSeverity", "UNKNOWN")
-                break
+        v3_list = metrics.get("cvssMetricV31") or metrics.get("cvssMetricV30")
+        if v3_list:
+            cvss_data = v3_list[0].get("cvssData", {})
+            cvss_score = cvss_data.get("baseScore", 0.0)
+            severity = cvss_data.get("baseSeverity", "UNKNOWN")
 
         if cvss_score == 0.0:
-            v2_list = metrics.get("cvssMetricV2", [])
+            v2_list = metrics.get("cvssMetricV2")
             if v2_list:
                 cvss_data = v2_list[0].get("cvssData", {})
                 cvss_score = cvss_data.get("baseScore", 0.0)
                 severity = "HIGH" if cvss_score >= 7.0 else "MEDIUM" if cvss_score >= 4.0 else "LOW"
 
+        # Skip if below CVSS threshold, before any of the heavier extraction below
+        if cvss_score < self._config.nvd_min_cvss:
+            return None
+
+        # Get English description, else the first one
+        descriptions = cve.get("descriptions", [])
+        description = next(
+            (d.get("value", "") for d in descriptions if d.get("lang") == "en"),
+            descriptions[0].get("value", "") if descriptions else "",
+        )
+
         # Extract CWE
         cwe_ids = []
         weaknesses = cve.get("weaknesses", [])
@@ -140,20 +208,9 @@ class NVDCollector(Collector):
                 if desc.get("lang") == "en" and desc.get("value", "").startswith("CWE-"):
                     cwe_ids.append(desc["value"])
 
-        # Extract affected products (simplified)
-        affected_products = []
-        configurations = cve.get("configurations", [])
-        for config_node in configurations:
-            for node in config_node.get("nodes", []):
-                for cpe_match in node.get("cpeMatch", []):
-                    criteria = cpe_match.get("criteria", "")
-                    if criteria:
-                        # Extract vendor:product from CPE string
-                        parts = criteria.split(":")
-                        if len(parts) >= 5:
-                            affected_products.append(f"{parts[3]}:{parts[4]}")
-
-        url = f"https://nvd.nist.gov/vuln/detail/{cve_id}"
+        affected_products = _affected_products(cve.get("configurations", []))
+
+        url = self.NVD_DETAIL_URL + cve_id
         title = f"[{severity}] {cve_id}: {description[:100]}"
 
         return Item(
@@ -167,6 +224,6 @@ class NVDCollector(Collector):
                 "cvss_score": cvss_score,
                 "severity": severity,
                 "cwe_ids": cwe_ids[:5],
-                "affected_products": affected_products[:10],
+                "affected_products": affected_products,
             },
         )
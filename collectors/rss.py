@@ -4,68 +4,112 @@ RSS/Atom feed collector. Uses feedparser.
 Simple: fetch feeds, extract entries, dedup by ID.
 """
 
+import calendar
+import html
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from time import mktime
 
 import feedparser
-import requests
 
-from collectors.base import Collector
+from collectors.base import Collector, make_session
 from config.settings import Config
 from models import Item, Source
 from storage.db import Storage
 
 log = logging.getLogger(__name__)
 
+# HTML stripping: drop script/style bodies and comments, then tags, then
+# decode entities. Not a full parser, but sufficient for scoring.
+_DROP_RE = re.compile(r"<(script|style)\b.*?</\1\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+def _strip_html(body: str) -> str:
+    if "<" in body:
+        body = _TAG_RE.sub(" ", _DROP_RE.sub(" ", body))
+    if "&" in body:
+        body = html.unescape(body)
+    return _WS_RE.sub(" ", body).strip()
+
 
 class RSSCollector(Collector):
     def __init__(self, storage: Storage, config: Config):
         super().__init__(storage)
         self._feeds = config.rss_feeds
-        self._session = requests.Session()
-        self._session.headers["User-Agent"] = "signal-extract/0.1"
+        self._session = make_session()
 
     def name(self) -> str:
         return "rss"
 
     def collect(self) -> list[Item]:
+        self._load_known(Source.RSS)
         state = self.storage.get_collector_state(self.name())
         items: list[Item] = []
-
-        for feed_url in self._feeds:
-            try:
-                items.extend(self._collect_feed(feed_url, state))
-            except Exception as e:
-                log.warning(f"RSS error for {feed_url}: {e}")
-                continue
+        if not self._feeds:
+            return items
+
+        # Feeds are fetched and parsed concurrently. Workers only read state;
+        # their conditional-request headers are merged here, in feed order.
+        with ThreadPoolExecutor(max_workers=min(16, len(self._feeds))) as pool:
+            futures = [
+                (feed_url, pool.submit(self._collect_feed, feed_url, state))
+                for feed_url in self._feeds
+            ]
+            for feed_url, future in futures:
+                try:
+                    feed_items, state_updates = future.result()
+                except Exception as e:
+                    log.warning(f"RSS error for {feed_url}: {e}")
+                    continue
+                state.update(state_updates)
+                items.extend(feed_items)
 
         self.storage.set_collector_state(self.name(), state)
-        return items
+        return self._drop_stored(items)
 
-    def _collect_feed(self, feed_url: str, state: dict) -> list[Item]:
-        """Parse a single feed, return new entries."""
+    def _collect_feed(self, feed_url: str, state: dict) -> tuple[list[Item], dict]:
+        """
+        Parse a single feed. Returns (entries, state updates); dedup and the
+        state merge happen in collect().
+        """
         # Use etag/modified for conditional requests
         etag = state.get(f"etag:{feed_url}", "")
         modified = state.get(f"modified:{feed_url}", "")
 
-        feed = feedparser.parse(
-            feed_url,
-            etag=etag or None,
-            modified=modified or None,
-        )
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+
+        # Fetch over the shared session (keep-alive), let feedparser only parse
+        resp = self._session.get(feed_url, headers=headers, timeout=15)
 
         # Update conditional request headers for next time
-        if hasattr(feed, "etag") and feed.etag:
-            state[f"etag:{feed_url}"] = feed.etag
-        if hasattr(feed, "modified") and feed.modified:
-            state[f"modified:{feed_url}"] = feed.modified
+        state_updates = {}
+        if resp.headers.get("ETag"):
+            state_updates[f"etag:{feed_url}"] = resp.headers["ETag"]
+        if resp.headers.get("Last-Modified"):
+            state_updates[f"modified:{feed_url}"] = resp.headers["Last-Modified"]
 
         # Status 304 = not modified
-        if hasattr(feed, "status") and feed.status == 304:
-            return []
+        if resp.status_code == 304:
+            return [], state_updates
+        resp.raise_for_status()
+
+        feed = feedparser.parse(
+            resp.content,
+            response_headers={
+                "content-type": resp.headers.get("Content-Type", ""),
+                "content-location": resp.url,
+            },
+        )
 
         items = []
+        now = datetime.now(timezone.utc)
         feed_title = feed.feed.get("title", feed_url) if feed.feed else feed_url
 
         for entry in feed.entries[:10]:  # cap per feed
@@ -79,20 +123,17 @@ class RSSCollector(Collector):
             elif entry.get("content"):
                 body = entry.content[0].get("value", "")
 
-            # Strip HTML tags (crude but sufficient for scoring)
-            import re
-            body = re.sub(r"<[^>]+>", " ", body)
-            body = re.sub(r"\s+", " ", body).strip()
+            body = _strip_html(body)
 
             if len(body) > 3000:
                 body = body[:3000] + "\n[truncated]"
 
-            # Parse published date
-            published = datetime.now(timezone.utc)
+            # Parse published date (feedparser normalizes it to a UTC struct_time)
+            published = now
             if entry.get("published_parsed"):
                 try:
                     published = datetime.fromtimestamp(
-                        mktime(entry.published_parsed), tz=timezone.utc
+                        calendar.timegm(entry.published_parsed), tz=timezone.utc
                     )
                 except (ValueError, OverflowError):
                     pass
@@ -112,7 +153,6 @@ class RSSCollector(Collector):
                 collected_at=published,
             )
 
-            if not self.storage.has_item(item.content_hash):
-                items.append(item)
+            items.append(item)
 
-        return items
+        return items, state_updates
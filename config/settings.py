@@ -11,6 +11,132 @@ from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
+# Default watch lists. Module-level constants so each Config() only copies
+# them into a fresh list instead of rebuilding the literals.
+
+_GITHUB_REPOS: tuple[str, ...] = (
+    # GitHub's own infra — where workflow pain is filed directly
+    "actions/runner",
+    "actions/runner-images",
+    "cli/cli",
+    "github/codeql",
+    # CI/CD tools with heavy GitHub integration
+    "dependabot/dependabot-core",
+    "nektos/act",
+    # Popular actions where friction surfaces as issues
+    "actions/checkout",
+    "actions/cache",
+    "actions/setup-node",
+    "actions/setup-python",
+    "docker/build-push-action",
+    # Code review and PR automation tooling
+    "reviewdog/reviewdog",
+    "danger/danger-js",
+    "hmarr/auto-approve-action",
+    # Security and compliance tools
+    "step-security/harden-runner",
+    "aquasecurity/trivy-action",
+    "ossf/scorecard-action",
+    # ── Enterprise security & compliance ──
+    "bridgecrewio/checkov",
+    "aquasecurity/trivy",
+    "anchore/grype",
+    "anchore/syft",
+    "sigstore/cosign",
+    "falcosecurity/falco",
+    "open-policy-agent/opa",
+    "open-policy-agent/gatekeeper",
+    # ── Infrastructure & DevOps ──
+    "hashicorp/terraform",
+    "hashicorp/vault",
+    "pulumi/pulumi",
+    "argoproj/argo-cd",
+    "fluxcd/flux2",
+    # ── Observability ──
+    "grafana/grafana",
+    "prometheus/prometheus",
+    # ── Platform engineering ──
+    "backstage/backstage",
+    "crossplane/crossplane",
+)
+
+_GITHUB_DISCUSSIONS_REPOS: tuple[str, ...] = (
+    "community/community",
+    "actions/runner",
+    "hashicorp/terraform",
+    "backstage/backstage",
+)
+
+_RSS_FEEDS: tuple[str, ...] = (
+    # Developer platform blogs
+    "https://github.blog/feed/",
+    "https://devops.com/feed/",
+    "https://www.thoughtworks.com/rss/insights.xml",
+    "https://blog.pragmaticengineer.com/rss/",
+    "https://martinfowler.com/feed.atom",
+    "https://www.docker.com/blog/feed/",
+    # Reddit subreddits via RSS (no auth needed)
+    "https://www.reddit.com/r/github/.rss",
+    "https://www.reddit.com/r/devops/.rss",
+    "https://www.reddit.com/r/githubactions/.rss",
+    # ── Enterprise-focused subreddits ──
+    "https://www.reddit.com/r/netsec/.rss",
+    "https://www.reddit.com/r/sysadmin/.rss",
+    "https://www.reddit.com/r/kubernetes/.rss",
+    "https://www.reddit.com/r/Terraform/.rss",
+    "https://www.reddit.com/r/devsecops/.rss",
+    # ── Cloud provider blogs ──
+    "https://aws.amazon.com/blogs/security/feed/",
+    "https://aws.amazon.com/blogs/devops/feed/",
+    "https://cloud.google.com/feeds/blog.xml",
+    "https://azure.microsoft.com/en-us/blog/feed/",
+    # ── Dev community ──
+    "https://dev.to/feed/tag/security",
+    "https://dev.to/feed/tag/devops",
+    "https://dev.to/feed/tag/kubernetes",
+    "https://www.infoq.com/feed/",
+    # ── Stack Overflow via RSS (tag-based) ──
+    "https://stackoverflow.com/feeds/tag/devsecops",
+    "https://stackoverflow.com/feeds/tag/kubernetes-security",
+    "https://stackoverflow.com/feeds/tag/terraform",
+    "https://stackoverflow.com/feeds/tag/ci-cd",
+    "https://stackoverflow.com/feeds/tag/github-actions",
+)
+
+_HN_SEARCH_KEYWORDS: tuple[str, ...] = (
+    # Existing — still relevant
+    "github actions",
+    "github marketplace",
+    "github app",
+    "code review automation",
+    "CI/CD pipeline",
+    "developer experience",
+    "devtools",
+    "github workflow",
+    "pull request review",
+    "dependency management",
+    "github bot",
+    "CODEOWNERS",
+    # ── Enterprise / boring opportunity keywords ──
+    "SOC2 compliance",
+    "security audit automation",
+    "vulnerability management",
+    "SBOM software bill of materials",
+    "infrastructure as code",
+    "terraform drift",
+    "kubernetes security",
+    "secrets management",
+    "platform engineering",
+    "developer portal",
+    "DORA metrics",
+    "incident management",
+    "DevSecOps",
+    "software supply chain security",
+    "flaky tests",
+    "cloud cost optimization",
+    "policy as code",
+)
+
 
 @dataclass
 class Config:
@@ -43,138 +169,23 @@ class Config:
 
     # ── GitHub repos to watch (issues + releases) ──
     # Enterprise dev-tool ecosystem: CI/CD, security, infrastructure, observability
-    github_repos: list[str] = field(default_factory=lambda: [
-        # GitHub's own infra — where workflow pain is filed directly
-        "actions/runner",
-        "actions/runner-images",
-        "cli/cli",
-        "github/codeql",
-        # CI/CD tools with heavy GitHub integration
-        "dependabot/dependabot-core",
-        "nektos/act",
-        # Popular actions where friction surfaces as issues
-        "actions/checkout",
-        "actions/cache",
-        "actions/setup-node",
-        "actions/setup-python",
-        "docker/build-push-action",
-        # Code review and PR automation tooling
-        "reviewdog/reviewdog",
-        "danger/danger-js",
-        "hmarr/auto-approve-action",
-        # Security and compliance tools
-        "step-security/harden-runner",
-        "aquasecurity/trivy-action",
-        "ossf/scorecard-action",
-        # ── Enterprise security & compliance ──
-        "bridgecrewio/checkov",
-        "aquasecurity/trivy",
-        "anchore/grype",
-        "anchore/syft",
-        "sigstore/cosign",
-        "falcosecurity/falco",
-        "open-policy-agent/opa",
-        "open-policy-agent/gatekeeper",
-        # ── Infrastructure & DevOps ──
-        "hashicorp/terraform",
-        "hashicorp/vault",
-        "pulumi/pulumi",
-        "argoproj/argo-cd",
-        "fluxcd/flux2",
-        # ── Observability ──
-        "grafana/grafana",
-        "prometheus/prometheus",
-        # ── Platform engineering ──
-        "backstage/backstage",
-        "crossplane/crossplane",
-    ])
+    github_repos: list[str] = field(default_factory=lambda: list(_GITHUB_REPOS))
 
     # GitHub token — required for Discussions collector, recommended for rate limits
     github_token: str = os.environ.get("GITHUB_TOKEN", "")
 
     # ── GitHub Discussions repos (GraphQL, requires GITHUB_TOKEN) ──
-    github_discussions_repos: list[str] = field(default_factory=lambda: [
-        "community/community",
-        "actions/runner",
-        "hashicorp/terraform",
-        "backstage/backstage",
-    ])
+    github_discussions_repos: list[str] = field(default_factory=lambda: list(_GITHUB_DISCUSSIONS_REPOS))
 
     # ── RSS feeds — enterprise dev-tool, security, infrastructure, cloud blogs ──
-    rss_feeds: list[str] = field(default_factory=lambda: [
-        # Developer platform blogs
-        "https://github.blog/feed/",
-        "https://devops.com/feed/",
-        "https://www.thoughtworks.com/rss/insights.xml",
-        "https://blog.pragmaticengineer.com/rss/",
-        "https://martinfowler.com/feed.atom",
-        "https://www.docker.com/blog/feed/",
-        # Reddit subreddits via RSS (no auth needed)
-        "https://www.reddit.com/r/github/.rss",
-        "https://www.reddit.com/r/devops/.rss",
-        "https://www.reddit.com/r/githubactions/.rss",
-        # ── Enterprise-focused subreddits ──
-        "https://www.reddit.com/r/netsec/.rss",
-        "https://www.reddit.com/r/sysadmin/.rss",
-        "https://www.reddit.com/r/kubernetes/.rss",
-        "https://www.reddit.com/r/Terraform/.rss",
-        "https://www.reddit.com/r/devsecops/.rss",
-        # ── Cloud provider blogs ──
-        "https://aws.amazon.com/blogs/security/feed/",
-        "https://aws.amazon.com/blogs/devops/feed/",
-        "https://cloud.google.com/feeds/blog.xml",
-        "https://azure.microsoft.com/en-us/blog/feed/",
-        # ── Dev community ──
-        "https://dev.to/feed/tag/security",
-        "https://dev.to/feed/tag/devops",
-        "https://dev.to/feed/tag/kubernetes",
-        "https://www.infoq.com/feed/",
-        # ── Stack Overflow via RSS (tag-based) ──
-        "https://stackoverflow.com/feeds/tag/devsecops",
-        "https://stackoverflow.com/feeds/tag/kubernetes-security",
-        "https://stackoverflow.com/feeds/tag/terraform",
-        "https://stackoverflow.com/feeds/tag/ci-cd",
-        "https://stackoverflow.com/feeds/tag/github-actions",
-    ])
+    rss_feeds: list[str] = field(default_factory=lambda: list(_RSS_FEEDS))
 
     # ── HN settings ──
     hn_min_score: int = int(os.environ.get("SIGNAL_HN_MIN_SCORE", "100"))
     hn_max_items: int = int(os.environ.get("SIGNAL_HN_MAX_ITEMS", "30"))
 
     # HN keyword search — targeted queries via Algolia API
-    hn_search_keywords: list[str] = field(default_factory=lambda: [
-        # Existing — still relevant
-        "github actions",
-        "github marketplace",
-        "github app",
-        "code review automation",
-        "CI/CD pipeline",
-        "developer experience",
-        "devtools",
-        "github workflow",
-        "pull request review",
-        "dependency management",
-        "github bot",
-        "CODEOWNERS",
-        # ── Enterprise / boring opportunity keywords ──
-        "SOC2 compliance",
-        "security audit automation",
-        "vulnerability management",
-        "SBOM software bill of materials",
-        "infrastructure as code",
-        "terraform drift",
-        "kubernetes security",
-        "secrets management",
-        "platform engineering",
-        "developer portal",
-        "DORA metrics",
-        "incident management",
-        "DevSecOps",
-        "software supply chain security",
-        "flaky tests",
-        "cloud cost optimization",
-        "policy as code",
-    ])
+    hn_search_keywords: list[str] = field(default_factory=lambda: list(_HN_SEARCH_KEYWORDS))
     hn_search_min_score: int = int(os.environ.get("SIGNAL_HN_SEARCH_MIN_SCORE", "50"))
 
     # ── NVD / CVE settings ──
@@ -1,3 +1,9 @@
-from delivery.output import deliver_cli, deliver_email
+from delivery.output import (
+    EmailDelivery, deliver_cli, deliver_email, deliver_email_async,
+    deliver_emails, deliver_emails_async,
+)
 
-__all__ = ["deliver_cli", "deliver_email"]
+__all__ = [
+    "EmailDelivery", "deliver_cli", "deliver_email", "deliver_email_async",
+    "deliver_emails", "deliver_emails_async",
+]
@@ -4,9 +4,10 @@ Output delivery. CLI (stdout) and email.
 CLI is the primary interface. Email is optional for scheduled runs.
 """
 
+import atexit
 import logging
 import smtplib
-from datetime import datetime, timezone
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.text import MIMEText
 
 from config.settings import Config
@@ -14,6 +15,14 @@ from models import Digest, QAResult
 
 log = logging.getLogger(__name__)
 
+# Per socket operation. Also bounds how long exit can wait on a pending send.
+SMTP_TIMEOUT = 30
+
+# Background sends for deliver_email_async. Workers start on first submit;
+# pending emails are flushed before the interpreter exits.
+_MAIL_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="email")
+atexit.register(_MAIL_POOL.shutdown, wait=True)
+
 
 def deliver_cli(content: Digest | QAResult):
     """Print to stdout. That's it."""
@@ -38,7 +47,7 @@ def deliver_cli(content: Digest | QAResult):
 
     elif isinstance(content, QAResult):
         print(f"\n{separator}")
-        print(f"  Q&A")
+        print("  Q&A")
         print(separator)
         print(f"  Q: {content.question}")
         print(f"  ({content.sources_used} sources searched)")
@@ -49,34 +58,101 @@ def deliver_cli(content: Digest | QAResult):
         print(separator)
 
 
-def deliver_email(content: Digest | QAResult, config: Config) -> bool:
-    """Send via SMTP. Returns True on success."""
-    if not config.smtp_host or not config.email_to:
-        log.warning("Email not configured (SIGNAL_SMTP_HOST, SIGNAL_EMAIL_TO)")
-        return False
+class EmailDelivery:
+    """
+    SMTP delivery that keeps one connection open across sends:
 
-    if isinstance(content, Digest):
-        subject = f"[signal] {content.digest_type} — {content.generated_at.strftime('%Y-%m-%d')}"
-        body = content.content
-    elif isinstance(content, QAResult):
-        subject = f"[signal] Q&A — {content.question[:50]}"
-        body = f"Q: {content.question}\n\nA: {content.answer}"
-    else:
-        return False
-
-    msg = MIMEText(body, "plain", "utf-8")
-    msg["Subject"] = subject
-    msg["From"] = config.email_from
-    msg["To"] = config.email_to
-
-    try:
-        with smtplib.SMTP(config.smtp_host, config.smtp_port) as server:
+        with EmailDelivery(config) as email:
+            email.send(daily)
+            email.send(weekly)
+
+    Connects (STARTTLS + login) lazily on the first send. A failed send
+    drops the connection; the next send reconnects.
+    """
+
+    def __init__(self, config: Config):
+        self._config = config
+        self._server: smtplib.SMTP | None = None
+
+    def __enter__(self) -> "EmailDelivery":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        config = self._config
+        server = smtplib.SMTP(config.smtp_host, config.smtp_port, timeout=SMTP_TIMEOUT)
+        try:
             server.starttls()
             if config.smtp_user:
                 server.login(config.smtp_user, config.smtp_pass)
-            server.send_message(msg)
-        log.info(f"Email sent: {subject}")
-        return True
-    except Exception as e:
-        log.error(f"Email delivery failed: {e}")
-        return False
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:
+            self._server.close()
+        self._server = None
+
+    def send(self, content: Digest | QAResult) -> bool:
+        """Send one message. Returns True on success."""
+        config = self._config
+        if not config.smtp_host or not config.email_to:
+            log.warning("Email not configured (SIGNAL_SMTP_HOST, SIGNAL_EMAIL_TO)")
+            return False
+
+        if isinstance(content, Digest):
+            subject = f"[signal] {content.digest_type} — {content.generated_at.strftime('%Y-%m-%d')}"
+            body = content.content
+        elif isinstance(content, QAResult):
+            subject = f"[signal] Q&A — {content.question[:50]}"
+            body = f"Q: {content.question}\n\nA: {content.answer}"
+        else:
+            return False
+
+        msg = MIMEText(body, "plain", "utf-8")
+        msg["Subject"] = subject
+        msg["From"] = config.email_from
+        msg["To"] = config.email_to
+
+        try:
+            if self._server is None:
+                self._server = self._connect()
+            self._server.send_message(msg)
+            log.info(f"Email sent: {subject}")
+            return True
+        except Exception as e:
+            log.error(f"Email delivery failed: {e}")
+            self.close()
+            return False
+
+
+def deliver_email(content: Digest | QAResult, config: Config) -> bool:
+    """Send a single message via SMTP. Returns True on success."""
+    return deliver_emails([content], config) == 1
+
+
+def deliver_emails(contents: list[Digest | QAResult], config: Config) -> int:
+    """Send several messages over one SMTP connection. Returns how many were sent."""
+    with EmailDelivery(config) as email:
+        return sum(email.send(content) for content in contents)
+
+
+def deliver_email_async(content: Digest | QAResult, config: Config) -> Future:
+    """
+    deliver_email on a background thread, so the caller can print to the CLI
+    while SMTP connects. Returns a Future resolving to deliver_email's bool.
+    """
+    return _MAIL_POOL.submit(deliver_email, content, config)
+
+
+def deliver_emails_async(contents: list[Digest | QAResult], config: Config) -> Future:
+    """deliver_emails as one background job. Returns a Future resolving to the sent count."""
+    return _MAIL_POOL.submit(deliver_emails, contents, config)
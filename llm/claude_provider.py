@@ -2,18 +2,26 @@
 Claude (Anthropic) LLM provider implementation.
 """
 
+from functools import lru_cache
+
 from llm.provider import LLMProvider, LLMResponse, LLMError
 
 
+@lru_cache(maxsize=8)
+def _get_client(api_key: str):
+    """One Anthropic client (and its connection pool) per key, reused by every ClaudeProvider."""
+    try:
+        import anthropic
+    except ImportError:
+        raise LLMError("anthropic package not installed: pip install anthropic")
+    return anthropic.Anthropic(api_key=api_key)
+
+
 class ClaudeProvider(LLMProvider):
     def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
         if not api_key:
             raise LLMError("ANTHROPIC_API_KEY not set")
-        try:
-            import anthropic
-        except ImportError:
-            raise LLMError("anthropic package not installed: pip install anthropic")
-        self._client = anthropic.Anthropic(api_key=api_key)
+        self._client = _get_client(api_key)
         self._model = model
 
     def complete(
@@ -2,18 +2,26 @@
 OpenAI LLM provider implementation.
 """
 
+from functools import lru_cache
+
 from llm.provider import LLMProvider, LLMResponse, LLMError
 
 
+@lru_cache(maxsize=8)
+def _get_client(api_key: str):
+    """One OpenAI client (and its connection pool) per key, reused by every OpenAIProvider."""
+    try:
+        import openai
+    except ImportError:
+        raise LLMError("openai package not installed: pip install openai")
+    return openai.OpenAI(api_key=api_key)
+
+
 class OpenAIProvider(LLMProvider):
     def __init__(self, api_key: str, model: str = "gpt-4o"):
         if not api_key:
             raise LLMError("OPENAI_API_KEY not set")
-        try:
-            import openai
-        except ImportError:
-            raise LLMError("openai package not installed: pip install openai")
-        self._client = openai.OpenAI(api_key=api_key)
+        self._client = _get_client(api_key)
         self._model = model
 
     def complete(
@@ -5,21 +5,28 @@ OpenRouter exposes an OpenAI-compatible API at https://openrouter.ai/api/v1.
 Uses the OpenAI SDK with a custom base_url. No extra dependencies.
 """
 
+from functools import lru_cache
+
 from llm.provider import LLMProvider, LLMResponse, LLMError
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str):
+    """One OpenRouter-bound OpenAI client per key, reused by every OpenRouterProvider."""
+    try:
+        import openai
+    except ImportError:
+        raise LLMError("openai package not installed: pip install openai")
+    return openai.OpenAI(api_key=api_key, base_url=OPENROUTER_BASE_URL)
+
 
 class OpenRouterProvider(LLMProvider):
     def __init__(self, api_key: str, model: str = "anthropic/claude-sonnet-4"):
         if not api_key:
             raise LLMError("OPENROUTER_API_KEY not set")
-        try:
-            import openai
-        except ImportError:
-            raise LLMError("openai package not installed: pip install openai")
-        self._client = openai.OpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1",
-        )
+        self._client = _get_client(api_key)
         self._model = model
 
     def complete(
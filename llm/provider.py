@@ -10,9 +10,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMResponse:
-    """What comes back from any LLM call."""
+    """What comes back from any LLM call. Immutable; no per-instance __dict__."""
     text: str
     input_tokens: int
     output_tokens: int
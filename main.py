@@ -8,9 +8,11 @@ Usage:
     python main.py weekly               # Generate weekly enterprise dev-tool synthesis
     python main.py opportunities        # Generate deep enterprise opportunity report (14-day window)
     python main.py opportunities-json   # Generate structured JSON opportunity report
+    python main.py reports              # digest + weekly + opportunities, LLM calls in parallel
     python main.py ask "question"       # Ask about recent enterprise signals
     python main.py run                  # collect + digest (for cron)
     python main.py stats                # Show collection stats
+    python main.py vacuum               # Compact the database (occasional maintenance)
     python main.py serve                # Start web UI server
 """
 
@@ -18,17 +20,15 @@ import argparse
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Collectors, the scorer (which compiles its pattern database on import), the
+# LLM layer and Flask are imported by the commands that use them, so `stats`
+# and friends start fast.
 from config import load_config
-from collectors import GitHubCollector, GitHubDiscussionsCollector, HackerNewsCollector, RSSCollector
-from collectors.nvd import NVDCollector
-from filters import filter_items
-from llm import create_provider
 from storage import Storage
-from synthesizer.engine import Synthesizer
-from qa import QAHandler
-from delivery import deliver_cli, deliver_email
+from delivery import deliver_cli, deliver_email_async, deliver_emails_async
 
 
 def setup_logging(verbose: bool = False):
@@ -42,6 +42,10 @@ def setup_logging(verbose: bool = False):
 
 def cmd_collect(config, storage) -> int:
     """Run all collectors, filter, and store."""
+    from collectors import GitHubCollector, GitHubDiscussionsCollector, HackerNewsCollector, RSSCollector
+    from collectors.nvd import NVDCollector
+    from filters import filter_items
+
     collectors = [
         GitHubCollector(storage, config),
         GitHubDiscussionsCollector(storage, config),
@@ -53,22 +57,28 @@ def cmd_collect(config, storage) -> int:
     total_raw = 0
     total_stored = 0
 
-    for collector in collectors:
-        log = logging.getLogger(collector.name())
-        try:
-            raw_items = collector.collect()
-            log.info(f"Collected {len(raw_items)} raw items")
-            total_raw += len(raw_items)
-
-            if raw_items:
-                filtered = filter_items(raw_items, threshold=config.score_threshold)
-                log.info(f"After filtering: {len(filtered)} items (threshold={config.score_threshold})")
-
-                new_count = storage.insert_items(filtered)
-                log.info(f"Stored {new_count} new items")
-                total_stored += new_count
-        except Exception as e:
-            log.error(f"Collector {collector.name()} failed: {e}")
+    # Collectors are network-bound and independent, so they all run at once.
+    # Filtering and inserting stay on this thread, in completion order.
+    with ThreadPoolExecutor(max_workers=len(collectors)) as pool:
+        futures = {pool.submit(collector.collect): collector for collector in collectors}
+        for future in as_completed(futures):
+            collector = futures[future]
+            log = logging.getLogger(collector.name())
+            try:
+                raw_items = future.result()
+                log.info(f"Collected {len(raw_items)} raw items")
+                total_raw += len(raw_items)
+
+                if raw_items:
+                    filtered = filter_items(raw_items, threshold=config.score_threshold)
+                    log.info(f"After filtering: {len(filtered)} items (threshold={config.score_threshold})")
+
+                    new_count = storage.insert_items(filtered)
+                    log.info(f"Stored {new_count} new items")
+                    total_stored += new_count
+                collector.commit()
+            except Exception as e:
+                log.error(f"Collector {collector.name()} failed: {e}")
 
     print(f"Collected: {total_raw} raw -> {total_stored} stored")
     return total_stored
@@ -76,42 +86,71 @@ def cmd_collect(config, storage) -> int:
 
 def cmd_digest(config, storage):
     """Generate and deliver daily enterprise opportunity scan."""
+    from llm import create_provider
+    from synthesizer.engine import Synthesizer
+
     llm = create_provider(config)
     synth = Synthesizer(llm, storage)
 
     digest = synth.daily_digest()
     if digest:
-        deliver_cli(digest)
         if config.smtp_host:
-            deliver_email(digest, config)
+            deliver_email_async(digest, config)
+        deliver_cli(digest)
 
 
 def cmd_weekly(config, storage):
     """Generate and deliver weekly enterprise dev-tool synthesis."""
+    from llm import create_provider
+    from synthesizer.engine import Synthesizer
+
     llm = create_provider(config)
     synth = Synthesizer(llm, storage)
 
     digest = synth.weekly_synthesis()
     if digest:
-        deliver_cli(digest)
         if config.smtp_host:
-            deliver_email(digest, config)
+            deliver_email_async(digest, config)
+        deliver_cli(digest)
 
 
 def cmd_opportunities(config, storage):
     """Generate deep enterprise opportunity report (14-day analysis window)."""
+    from llm import create_provider
+    from synthesizer.engine import Synthesizer
+
     llm = create_provider(config)
     synth = Synthesizer(llm, storage)
 
     digest = synth.opportunity_report()
     if digest:
-        deliver_cli(digest)
         if config.smtp_host:
-            deliver_email(digest, config)
+            deliver_email_async(digest, config)
+        deliver_cli(digest)
+
+
+def cmd_reports(config, storage):
+    """Generate daily, weekly and opportunity reports concurrently, deliver in that order."""
+    from llm import create_provider
+    from synthesizer.engine import Synthesizer
+
+    llm = create_provider(config)
+    synth = Synthesizer(llm, storage)
+
+    results = synth.run_reports("daily_digest", "weekly_synthesis", "opportunity_report")
+    digests = [digest for digest in results.values() if digest]
+    if digests and config.smtp_host:
+        # One SMTP connection and login for all of them
+        deliver_emails_async(digests, config)
+    for digest in digests:
+        deliver_cli(digest)
 
 
 def cmd_opportunities_json(config, storage, out_path: str | None = None):
     """Generate structured JSON opportunity report."""
+    from llm import create_provider
+    from synthesizer.engine import Synthesizer
+
     llm = create_provider(config)
     synth = Synthesizer(llm, storage)
 
@@ -139,6 +178,9 @@ def cmd_opportunities_json(config, storage, out_path: str | None = None):
 
 def cmd_ask(config, storage, question: str):
     """Answer a question about enterprise dev-tool signals."""
+    from llm import create_provider
+    from qa import QAHandler
+
     llm = create_provider(config)
     handler = QAHandler(llm, storage)
 
@@ -164,6 +206,14 @@ def cmd_stats(config, storage):
         print(f"  {source}: {count}")
 
 
+def cmd_vacuum(config, storage):
+    """Compact the database and refresh query planner statistics."""
+    size_before = config.db_path.stat().st_size
+    storage.vacuum()
+    size_after = config.db_path.stat().st_size
+    print(f"Vacuumed {config.db_path}: {size_before:,} -> {size_after:,} bytes")
+
+
 def cmd_serve(config, args):
     """Start the API + web UI server."""
     from api.server import create_app
@@ -198,6 +248,11 @@ def cli():
         help="Generate deep enterprise opportunity report (14-day window)",
     )
 
+    sub.add_parser(
+        "reports", parents=[common],
+        help="Generate digest, weekly and opportunities reports concurrently",
+    )
+
     opp_json_parser = sub.add_parser(
         "opportunities-json", parents=[common],
         help="Generate structured JSON opportunity report",
@@ -209,6 +264,7 @@ def cli():
 
     sub.add_parser("run", parents=[common], help="Collect + digest (for cron)")
     sub.add_parser("stats", parents=[common], help="Show collection stats")
+    sub.add_parser("vacuum", parents=[common], help="Compact the database")
 
     ask_parser = sub.add_parser("ask", parents=[common], help="Ask about enterprise dev-tool signals")
     ask_parser.add_argument("question", help="Your question")
@@ -243,6 +299,8 @@ def cli():
                 cmd_weekly(config, storage)
             case "opportunities":
                 cmd_opportunities(config, storage)
+            case "reports":
+                cmd_reports(config, storage)
             case "opportunities-json":
                 cmd_opportunities_json(config, storage, args.out)
             case "ask":
@@ -251,6 +309,8 @@ def cli():
                 cmd_run(config, storage)
             case "stats":
                 cmd_stats(config, storage)
+            case "vacuum":
+                cmd_vacuum(config, storage)
             case _:
                 parser.print_help()
     finally:
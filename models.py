@@ -17,7 +17,13 @@ class Source(Enum):
     NVD_CVE = "nvd_cve"
 
 
-@dataclass
+def content_hash_for(source: Source, source_id: str) -> str:
+    """Deterministic hash for dedup. Based on source + source_id."""
+    raw = f"{source.value}:{source_id}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+@dataclass(slots=True)
 class Item:
     """A single piece of collected content."""
     source: Source
@@ -28,18 +34,20 @@ class Item:
     metadata: dict = field(default_factory=dict)  # source-specific data
     collected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     score: int = 0          # signal score, 0-100, set by filter
+    _content_hash: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def content_hash(self) -> str:
-        """Deterministic hash for dedup. Based on source + source_id."""
-        raw = f"{self.source.value}:{self.source_id}"
-        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+        """Dedup hash (see content_hash_for). Memoized: collectors read it several times per item."""
+        if self._content_hash is None:
+            self._content_hash = content_hash_for(self.source, self.source_id)
+        return self._content_hash
 
     def __repr__(self) -> str:
         return f"Item({self.source.value}, {self.title[:50]}, score={self.score})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Digest:
     """Output of synthesis."""
     digest_type: str        # "daily" | "weekly" | "opportunities"
@@ -48,7 +56,7 @@ class Digest:
     generated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvidenceRef:
     """A reference from an opportunity back to a collected item."""
     source: str             # e.g. "github_issue", "hacker_news"
@@ -65,7 +73,7 @@ class EvidenceRef:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Opportunity:
     """A structured, machine-readable enterprise opportunity."""
     id: str                         # stable slug, e.g. "terraform-drift-detector"
@@ -102,7 +110,7 @@ class Opportunity:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QAResult:
     """Output of a Q&A query."""
     question: str
@@ -3,17 +3,37 @@ Q&A handler. Thin wrapper around the synthesizer's ask() method.
 
 Exists as a separate module for clarity and future extension
 (e.g., caching frequent questions, answer quality tracking).
+
+Answers are cached by normalized question + window. A cached answer is
+reused only while no new items have been stored, and for at most
+QA_CACHE_TTL (the window keeps sliding even when nothing new arrives).
 """
 
+import dataclasses
+import hashlib
+import logging
+from datetime import datetime, timezone, timedelta
+
 from llm.provider import LLMProvider
 from models import QAResult
 from storage.db import Storage
 from synthesizer.engine import Synthesizer
 
+log = logging.getLogger(__name__)
+
+QA_CACHE_TTL = timedelta(hours=6)
+
+
+def _question_hash(question: str, days: int) -> str:
+    """Cache key. Case and whitespace differences map to the same question."""
+    normalized = " ".join(question.casefold().split())
+    return hashlib.sha256(f"{days}|{normalized}".encode()).hexdigest()
+
 
 class QAHandler:
     def __init__(self, llm: LLMProvider, storage: Storage):
         self._synthesizer = Synthesizer(llm, storage)
+        self._storage = storage
 
     def ask(self, question: str, days: int = 7) -> QAResult | None:
         """
@@ -26,4 +46,17 @@ class QAHandler:
         Returns:
             QAResult or None on failure.
         """
-        return self._synthesizer.ask(question, days=days)
+        question_hash = _question_hash(question, days)
+        watermark = self._storage.items_watermark()
+        expire_before = datetime.now(timezone.utc) - QA_CACHE_TTL
+
+        cached = self._storage.get_cached_answer(question_hash, watermark, since=expire_before)
+        if cached:
+            log.info("Q&A cache hit; no new items since this was answered")
+            # The key ignores case and spacing; echo the question as asked
+            return dataclasses.replace(cached, question=question)
+
+        result = self._synthesizer.ask(question, days=days)
+        if result:
+            self._storage.save_cached_answer(question_hash, result, watermark, expire_before)
+        return result
@@ -1,3 +1,4 @@
+from storage.bloom import BloomFilter
 from storage.db import Storage
 
-__all__ = ["Storage"]
+__all__ = ["BloomFilter", "Storage"]
@@ -0,0 +1,62 @@
+"""
+Bloom filter for content-hash membership. Pure Python, no dependencies.
+
+False positives are possible (sized for ~0.1%), false negatives are not:
+a miss means the key was definitely never added.
+"""
+
+import hashlib
+import math
+import struct
+
+# size, hashes, capacity, count — little-endian, ahead of the bit array
+_HEADER = struct.Struct("<4Q")
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self._size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.capacity = capacity
+        self.count = 0
+
+    @property
+    def saturated(self) -> bool:
+        """More keys than it was sized for; the false-positive rate is climbing."""
+        return self.count > self.capacity
+
+    def to_bytes(self) -> bytes:
+        return _HEADER.pack(self._size, self._hashes, self.capacity, self.count) + self._bits
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """Inverse of to_bytes(). Raises ValueError on a truncated or corrupt buffer."""
+        if len(data) < _HEADER.size:
+            raise ValueError("truncated bloom filter header")
+        size, hashes, capacity, count = _HEADER.unpack_from(data)
+        bits = data[_HEADER.size:]
+        if not size or not hashes or len(bits) != (size + 7) // 8:
+            raise ValueError("corrupt bloom filter")
+        bloom = cls.__new__(cls)
+        bloom._size, bloom._hashes = size, hashes
+        bloom._bits = bytearray(bits)
+        bloom.capacity, bloom.count = capacity, count
+        return bloom
+
+    def _positions(self, key: str):
+        """k bit positions via double hashing over one 128-bit digest."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+    def add(self, key: str):
+        self.count += 1
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
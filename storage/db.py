@@ -1,34 +1,199 @@
 """
 SQLite storage. One file, one connection, no ORM.
 
+Collectors and reports run concurrently and share the connection; every
+method that uses it after setup holds a lock.
+
 Tables:
 - items: collected content with scores
 - collector_state: cursor/checkpoint per collector
 - digests: generated outputs for reference
+- qa_cache: recent Q&A answers, reused while no new items arrive
 - opportunity_runs: each structured opportunity generation run
 - opportunities: structured opportunity records
 - opportunity_evidence: evidence links from opportunities to items
+- item_source_counts: per-source row counts for items, kept by triggers
+- opportunities_fts: trigram index over opportunity buyer/market, kept by triggers
 """
 
-import json
+import os
 import sqlite3
+import struct
+import threading
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
+from operator import itemgetter
 from pathlib import Path
 
-from models import Item, Source, Opportunity, EvidenceRef
+import orjson
+
+from models import Item, Source, Opportunity, QAResult
+from storage.bloom import BloomFilter
+
+# Per-connection settings. NORMAL is durable under WAL (only the last commits
+# can be lost on power failure) and skips an fsync per commit; the larger page
+# cache and mmap keep the items indexes resident for dedup and digest reads.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA recursive_triggers=ON",  # INSERT OR REPLACE fires delete triggers
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# JSON columns (metadata, collector state) are orjson-encoded; keys are
+# stringified like the stdlib encoder did, and the column stays TEXT.
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(value) -> str:
+    return orjson.dumps(value, option=_JSON_OPTIONS).decode()
+
+
+# Columns _row_to_item unpacks, in order
+_ITEM_COLUMNS = "source, source_id, url, title, body, metadata, collected_at, score"
+_SOURCES = {source.value: source for source in Source}
+
+# Statements run per batch or per call, kept as constants like api/server.py's.
+# Their text is the key for sqlite3's prepared-statement cache.
+INSERT_ITEM_SQL = (
+    "INSERT OR IGNORE INTO items "
+    "(content_hash, source, source_id, url, title, body, metadata, score, collected_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+ITEMS_SINCE_SQL = f"SELECT {_ITEM_COLUMNS} FROM items WHERE collected_at >= ? AND score >= ?"
+ITEMS_ORDER_SQL = " ORDER BY score DESC, collected_at DESC"
+INSERT_OPPORTUNITY_SQL = (
+    "INSERT OR REPLACE INTO opportunities "
+    "(id, run_id, title, pain, target_buyer, solution_shape, market_type, "
+    "effort_estimate, monetization, moat, confidence, competition_notes, generated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_EVIDENCE_SQL = (
+    "INSERT INTO opportunity_evidence "
+    "(opportunity_id, run_id, source, item_title, url, score) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+def opportunity_text_filter(column: str, value: str, indexed: bool = True) -> tuple[str, str]:
+    """
+    (condition, param) for a case-insensitive substring filter on an
+    opportunities column aliased `o`. Uses the opportunities_fts trigram
+    index when it can: 3+ characters and no LIKE wildcards in value, which
+    keep their LIKE meaning. Otherwise, or if not indexed, a LIKE scan.
+    """
+    if indexed and len(value) >= 3 and "%" not in value and "_" not in value:
+        phrase = value.replace('"', '""')
+        return (
+            "o.rowid IN (SELECT rowid FROM opportunities_fts WHERE opportunities_fts MATCH ?)",
+            f'{column} : "{phrase}"',
+        )
+    return f"LOWER(o.{column}) LIKE ?", f"%{value.lower()}%"
+
+
+def fts_trigram_available(conn: sqlite3.Connection) -> bool:
+    """True if this SQLite build has FTS5 with the trigram tokenizer (3.34+)."""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts_probe USING fts5(x, tokenize='trigram')")
+    except sqlite3.OperationalError:
+        return False
+    conn.execute("DROP TABLE temp.fts_probe")
+    return True
+
+
+# Substring search for the buyer/market filters (external content), created
+# only where the build supports it
+_OPPORTUNITIES_FTS_DDL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS opportunities_fts USING fts5(
+        target_buyer, market_type,
+        content='opportunities', content_rowid='rowid', tokenize='trigram'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_insert AFTER INSERT ON opportunities
+    BEGIN
+        INSERT INTO opportunities_fts (rowid, target_buyer, market_type)
+        VALUES (NEW.rowid, NEW.target_buyer, NEW.market_type);
+    END;
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_delete AFTER DELETE ON opportunities
+    BEGIN
+        INSERT INTO opportunities_fts (opportunities_fts, rowid, target_buyer, market_type)
+        VALUES ('delete', OLD.rowid, OLD.target_buyer, OLD.market_type);
+    END;
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_update AFTER UPDATE ON opportunities
+    BEGIN
+        INSERT INTO opportunities_fts (opportunities_fts, rowid, target_buyer, market_type)
+        VALUES ('delete', OLD.rowid, OLD.target_buyer, OLD.market_type);
+        INSERT INTO opportunities_fts (rowid, target_buyer, market_type)
+        VALUES (NEW.rowid, NEW.target_buyer, NEW.market_type);
+    END;
+"""
+
+_OPPORTUNITIES_FTS_TRIGGERS = (
+    "opportunities_fts_insert", "opportunities_fts_update", "opportunities_fts_delete",
+)
+
+# json_group_array(... ORDER BY ...) needs SQLite 3.44. Before that the
+# trends arrays come back in unspecified order and are sorted in Python.
+ORDERED_AGGREGATES = sqlite3.sqlite_version_info >= (3, 44, 0)
+TREND_POINTS_ORDER = " ORDER BY generated_at, run_id" if ORDERED_AGGREGATES else ""
+
+
+def sorted_trend_points(points: str) -> list[dict]:
+    """Decode a trends data_points array, oldest run first."""
+    return sorted(orjson.loads(points), key=itemgetter("generated_at", "run_id"))
+
+
+# One row per opportunity id with its data points pre-built as a JSON array
+# and the title from the latest run. The array is oldest first where SQLite
+# can order the aggregate; otherwise callers sort it with sorted_trend_points.
+OPPORTUNITY_TRENDS_SQL = f"""
+    SELECT
+        o.id,
+        (SELECT l.title FROM opportunities l WHERE l.id = o.id
+         ORDER BY l.generated_at DESC LIMIT 1) AS title,
+        json_group_array(json_object(
+            'run_id', o.run_id,
+            'confidence', o.confidence,
+            'generated_at', o.generated_at
+        ){TREND_POINTS_ORDER}) AS data_points
+    FROM opportunities o
+    GROUP BY o.id
+    ORDER BY o.id
+"""
+
+
+# Persisted hash filters: highest items rowid covered, then the filter itself
+_BLOOM_WATERMARK = struct.Struct("<Q")
 
 
 class Storage:
     def __init__(self, db_path: Path):
         db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(db_path))
-        self._conn.execute("PRAGMA journal_mode=WAL")
-        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._bloom_dir = db_path.parent / "bloom"
+        # Larger statement cache (as the API pool): the IN/VALUES lists in
+        # dedup and evidence lookups compile one statement per batch size
+        self._conn = sqlite3.connect(
+            str(db_path), check_same_thread=False, cached_statements=256,
+        )
+        self._lock = threading.RLock()
+        for pragma in CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
         self._conn.row_factory = sqlite3.Row
         self._migrate()
 
     def _migrate(self):
         """Create tables if they don't exist. No migration framework needed."""
+        has_counts = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'item_source_counts'"
+        ).fetchone()
+        # Keyed on a trigger: a build without FTS drops them, and the index
+        # must be rebuilt once one with FTS opens the database again
+        has_fts = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'opportunities_fts_insert'"
+        ).fetchone()
         self._conn.executescript("""
             CREATE TABLE IF NOT EXISTS items (
                 content_hash TEXT PRIMARY KEY,
@@ -45,10 +210,17 @@ class Storage:
 
             CREATE INDEX IF NOT EXISTS idx_items_collected
                 ON items(collected_at);
-            CREATE INDEX IF NOT EXISTS idx_items_source
-                ON items(source);
-            CREATE INDEX IF NOT EXISTS idx_items_score
-                ON items(score);
+
+            -- Match the WHERE + ORDER BY of /api/items so paging is an
+            -- index range scan with no sort step. Their leading columns
+            -- also serve plain source/score lookups, so the old
+            -- single-column indexes are dropped.
+            CREATE INDEX IF NOT EXISTS idx_items_score_collected
+                ON items(score DESC, collected_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_items_source_score_collected
+                ON items(source, score DESC, collected_at DESC);
+            DROP INDEX IF EXISTS idx_items_source;
+            DROP INDEX IF EXISTS idx_items_score;
 
             CREATE TABLE IF NOT EXISTS collector_state (
                 collector_name TEXT PRIMARY KEY,
@@ -64,6 +236,15 @@ class Storage:
                 generated_at TEXT NOT NULL
             );
 
+            CREATE TABLE IF NOT EXISTS qa_cache (
+                question_hash TEXT PRIMARY KEY,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                sources_used INTEGER NOT NULL,
+                items_watermark INTEGER NOT NULL,
+                generated_at TEXT NOT NULL
+            );
+
             CREATE TABLE IF NOT EXISTS opportunity_runs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 digest_id INTEGER,
@@ -93,12 +274,16 @@ class Storage:
 
             CREATE INDEX IF NOT EXISTS idx_opportunities_run
                 ON opportunities(run_id);
-            CREATE INDEX IF NOT EXISTS idx_opportunities_confidence
-                ON opportunities(confidence);
             CREATE INDEX IF NOT EXISTS idx_opportunities_buyer
                 ON opportunities(target_buyer);
             CREATE INDEX IF NOT EXISTS idx_opportunities_market
                 ON opportunities(market_type);
+            CREATE INDEX IF NOT EXISTS idx_opportunities_confidence_generated
+                ON opportunities(confidence DESC, generated_at DESC);
+            -- Covers confidence-only filters too
+            DROP INDEX IF EXISTS idx_opportunities_confidence;
+            CREATE INDEX IF NOT EXISTS idx_opportunities_id_generated
+                ON opportunities(id, generated_at);
 
             CREATE TABLE IF NOT EXISTS opportunity_evidence (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -113,7 +298,47 @@ class Storage:
 
             CREATE INDEX IF NOT EXISTS idx_evidence_opportunity
                 ON opportunity_evidence(opportunity_id, run_id);
+
+            -- Rollup so stats never scan items
+            CREATE TABLE IF NOT EXISTS item_source_counts (
+                source TEXT PRIMARY KEY,
+                cnt INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE TRIGGER IF NOT EXISTS items_count_insert AFTER INSERT ON items
+            BEGIN
+                INSERT INTO item_source_counts (source, cnt) VALUES (NEW.source, 1)
+                ON CONFLICT(source) DO UPDATE SET cnt = cnt + 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS items_count_delete AFTER DELETE ON items
+            BEGIN
+                UPDATE item_source_counts SET cnt = cnt - 1 WHERE source = OLD.source;
+            END;
         """)
+        # Databases created before the rollup existed: count once
+        if not has_counts:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO item_source_counts (source, cnt) "
+                "SELECT source, COUNT(*) FROM items GROUP BY source"
+            )
+        # Older SQLite (< 3.34, or built without FTS5): filters fall back to
+        # LIKE, and triggers left by a newer build would break every write
+        self._has_fts = fts_trigram_available(self._conn)
+        if self._has_fts:
+            self._conn.executescript(_OPPORTUNITIES_FTS_DDL)
+            if not has_fts:
+                self._conn.execute(
+                    "INSERT INTO opportunities_fts (opportunities_fts) VALUES ('rebuild')"
+                )
+        else:
+            for trigger in _OPPORTUNITIES_FTS_TRIGGERS:
+                self._conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        # Gather planner statistics once so the composite indexes get picked
+        has_stats = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            self._conn.execute("ANALYZE")
         self._conn.commit()
 
     def insert_item(self, item: Item) -> bool:
@@ -121,106 +346,227 @@ class Storage:
         Insert an item. Returns True if new, False if duplicate.
         Idempotent — duplicates are silently ignored.
         """
-        try:
-            self._conn.execute(
-                """INSERT OR IGNORE INTO items
-                   (content_hash, source, source_id, url, title, body, metadata, score, collected_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    item.content_hash,
-                    item.source.value,
-                    item.source_id,
-                    item.url,
-                    item.title,
-                    item.body,
-                    json.dumps(item.metadata),
-                    item.score,
-                    item.collected_at.isoformat(),
-                ),
-            )
-            self._conn.commit()
-            return self._conn.execute(
-                "SELECT changes()"
-            ).fetchone()[0] > 0
-        except sqlite3.Error:
-            return False
+        return self.insert_items([item]) > 0
 
     def insert_items(self, items: list[Item]) -> int:
-        """Insert multiple items. Returns count of new items."""
-        new_count = 0
-        for item in items:
-            if self.insert_item(item):
-                new_count += 1
-        return new_count
+        """
+        Insert multiple items in one transaction. Returns count of new items;
+        duplicates are silently ignored. On a database error (e.g. "database
+        is locked") nothing from the batch is kept and the error is raised, so
+        the caller can log it and skip committing collector state.
+        """
+        rows = (
+            (
+                item.content_hash,
+                item.source.value,
+                item.source_id,
+                item.url,
+                item.title,
+                item.body,
+                _dumps(item.metadata),
+                item.score,
+                item.collected_at.isoformat(),
+            )
+            for item in items
+        )
+        # rowcount, not a total_changes delta: the latter also counts the
+        # item_source_counts trigger writes
+        with self._lock, self._conn:
+            return self._conn.executemany(INSERT_ITEM_SQL, rows).rowcount
 
     def has_item(self, content_hash: str) -> bool:
         """Check if an item already exists."""
-        row = self._conn.execute(
-            "SELECT 1 FROM items WHERE content_hash = ?", (content_hash,)
-        ).fetchone()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM items WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
         return row is not None
 
+    def existing_hashes(self, content_hashes: list[str]) -> set[str]:
+        """Return the subset of content_hashes already stored. One query per 999 hashes."""
+        with self._lock:
+            existing: set[str] = set()
+            for i in range(0, len(content_hashes), 999):
+                chunk = content_hashes[i:i + 999]
+                placeholders = ", ".join("?" * len(chunk))
+                existing.update(
+                    row[0] for row in self._conn.execute(
+                        f"SELECT content_hash FROM items WHERE content_hash IN ({placeholders})",
+                        chunk,
+                    )
+                )
+            return existing
+
+    def hash_filter(self, source: Source) -> BloomFilter:
+        """
+        Bloom filter holding every content hash stored for a source.
+
+        The filter is persisted next to the database with the highest items
+        rowid it covers, so each call only adds rows inserted since the last
+        one. A missing, unreadable or saturated file is rebuilt from a full
+        scan (which also compacts it).
+        """
+        with self._lock:
+            path = self._bloom_dir / f"{source.value}.bloom"
+            bloom, watermark = None, 0
+            try:
+                data = path.read_bytes()
+                (watermark,) = _BLOOM_WATERMARK.unpack_from(data)
+                bloom = BloomFilter.from_bytes(data[_BLOOM_WATERMARK.size:])
+            except (OSError, ValueError, struct.error):
+                pass
+
+            if bloom is None or bloom.saturated:
+                count = self._conn.execute(
+                    "SELECT COUNT(*) FROM items WHERE source = ?", (source.value,)
+                ).fetchone()[0]
+                bloom, watermark = BloomFilter(capacity=max(count * 2, 1000)), 0
+
+            top = watermark
+            for rowid, content_hash in self._conn.execute(
+                "SELECT rowid, content_hash FROM items WHERE source = ? AND rowid > ?",
+                (source.value, watermark),
+            ):
+                bloom.add(content_hash)
+                top = max(top, rowid)
+
+            if top != watermark or not path.exists():
+                self._bloom_dir.mkdir(exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(_BLOOM_WATERMARK.pack(top) + bloom.to_bytes())
+                os.replace(tmp, path)
+            return bloom
+
     def get_items_since(
         self,
         since: datetime,
         min_score: int = 0,
         source: Source | None = None,
+        limit: int | None = None,
     ) -> list[Item]:
-        """Get items collected after a given time, optionally filtered."""
-        query = "SELECT * FROM items WHERE collected_at >= ? AND score >= ?"
+        """
+        Get items collected after a given time, optionally filtered, best first.
+        The ORDER BY matches idx_items_score_collected (or its per-source
+        variant), so a limit stops the index scan early.
+        """
+        query = ITEMS_SINCE_SQL
         params: list = [since.isoformat(), min_score]
 
         if source:
             query += " AND source = ?"
             params.append(source.value)
 
-        query += " ORDER BY score DESC, collected_at DESC"
-        rows = self._conn.execute(query, params).fetchall()
+        query += ITEMS_ORDER_SQL
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
         return [self._row_to_item(r) for r in rows]
 
-    def get_items_last_n_days(self, days: int, min_score: int = 0) -> list[Item]:
+    def get_items_last_n_days(
+        self, days: int, min_score: int = 0, limit: int | None = None,
+    ) -> list[Item]:
         """Convenience: get items from the last N days."""
         since = datetime.now(timezone.utc) - timedelta(days=days)
-        return self.get_items_since(since, min_score=min_score)
+        return self.get_items_since(since, min_score=min_score, limit=limit)
+
+    def count_items_last_n_days(self, days: int, min_score: int = 0) -> int:
+        """How many items get_items_last_n_days would return without a limit."""
+        since = datetime.now(timezone.utc) - timedelta(days=days)
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM items WHERE collected_at >= ? AND score >= ?",
+                (since.isoformat(), min_score),
+            ).fetchone()[0]
 
     def get_collector_state(self, collector_name: str) -> dict:
         """Get saved state for a collector (cursors, timestamps, etc.)."""
-        row = self._conn.execute(
-            "SELECT state FROM collector_state WHERE collector_name = ?",
-            (collector_name,),
-        ).fetchone()
-        if row:
-            return json.loads(row[0])
-        return {}
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM collector_state WHERE collector_name = ?",
+                (collector_name,),
+            ).fetchone()
+            if row:
+                return orjson.loads(row[0])
+            return {}
 
     def set_collector_state(self, collector_name: str, state: dict):
         """Save collector state."""
-        self._conn.execute(
-            """INSERT INTO collector_state (collector_name, state, updated_at)
-               VALUES (?, ?, datetime('now'))
-               ON CONFLICT(collector_name)
-               DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at""",
-            (collector_name, json.dumps(state)),
-        )
-        self._conn.commit()
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO collector_state (collector_name, state, updated_at)
+                   VALUES (?, ?, datetime('now'))
+                   ON CONFLICT(collector_name)
+                   DO UPDATE SET state = excluded.state, updated_at = excluded.updated_at""",
+                (collector_name, _dumps(state)),
+            )
+            self._conn.commit()
 
-    def save_digest(self, digest_type: str, content: str, item_count: int):
-        """Save a generated digest for future reference."""
-        self._conn.execute(
-            "INSERT INTO digests (digest_type, content, item_count, generated_at) VALUES (?, ?, ?, ?)",
-            (digest_type, content, item_count, datetime.now(timezone.utc).isoformat()),
+    def save_digest(self, digest_type: str, content: str, item_count: int) -> int:
+        """Save a generated digest for future reference. Returns its id."""
+        with self._lock:
+            digest_id = self._conn.execute(
+                "INSERT INTO digests (digest_type, content, item_count, generated_at) VALUES (?, ?, ?, ?)",
+                (digest_type, content, item_count, datetime.now(timezone.utc).isoformat()),
+            ).lastrowid
+            self._conn.commit()
+        return digest_id
+
+    # ── Q&A answer cache ──
+
+    def items_watermark(self) -> int:
+        """Highest items rowid. Moves whenever an item is stored."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM items").fetchone()[0]
+
+    def get_cached_answer(
+        self, question_hash: str, items_watermark: int, since: datetime,
+    ) -> QAResult | None:
+        """A cached answer generated after since over the same items, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT question, answer, sources_used, generated_at FROM qa_cache "
+                "WHERE question_hash = ? AND items_watermark = ? AND generated_at >= ?",
+                (question_hash, items_watermark, since.isoformat()),
+            ).fetchone()
+        if row is None:
+            return None
+        question, answer, sources_used, generated_at = row
+        return QAResult(
+            question=question,
+            answer=answer,
+            sources_used=sources_used,
+            generated_at=datetime.fromisoformat(generated_at),
         )
-        self._conn.commit()
+
+    def save_cached_answer(
+        self, question_hash: str, result: QAResult, items_watermark: int, expire_before: datetime,
+    ):
+        """Cache an answer, replacing any for the same question, and drop expired ones."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM qa_cache WHERE generated_at < ?", (expire_before.isoformat(),)
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO qa_cache "
+                "(question_hash, question, answer, sources_used, items_watermark, generated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    question_hash, result.question, result.answer, result.sources_used,
+                    items_watermark, result.generated_at.isoformat(),
+                ),
+            )
 
     def get_stats(self) -> dict:
-        """Basic stats for debugging."""
-        total = self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
-        by_source = {}
-        for row in self._conn.execute(
-            "SELECT source, COUNT(*) as cnt FROM items GROUP BY source"
-        ):
-            by_source[row[0]] = row[1]
-        return {"total_items": total, "by_source": by_source}
+        """Basic stats for debugging. Read from the item_source_counts rollup."""
+        with self._lock:
+            by_source = {
+                source: cnt for source, cnt in self._conn.execute(
+                    "SELECT source, cnt FROM item_source_counts WHERE cnt > 0 ORDER BY source"
+                )
+            }
+        return {"total_items": sum(by_source.values()), "by_source": by_source}
 
     # ── Opportunity storage ──
 
@@ -231,40 +577,38 @@ class Storage:
         digest_id: int | None = None,
     ) -> int:
         """
-        Save a structured opportunity run with all opportunities and evidence.
-        Returns the run_id.
+        Save a structured opportunity run with all opportunities and evidence,
+        in one transaction. Returns the run_id.
         """
         now = datetime.now(timezone.utc).isoformat()
-        cursor = self._conn.execute(
-            "INSERT INTO opportunity_runs (digest_id, item_count, opportunity_count, generated_at) "
-            "VALUES (?, ?, ?, ?)",
-            (digest_id, item_count, len(opportunities), now),
-        )
-        run_id = cursor.lastrowid
-
-        for opp in opportunities:
-            self._conn.execute(
-                """INSERT OR REPLACE INTO opportunities
-                   (id, run_id, title, pain, target_buyer, solution_shape,
-                    market_type, effort_estimate, monetization, moat,
-                    confidence, competition_notes, generated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    opp.id, run_id, opp.title, opp.pain, opp.target_buyer,
-                    opp.solution_shape, opp.market_type, opp.effort_estimate,
-                    opp.monetization, opp.moat, opp.confidence,
-                    opp.competition_notes, now,
-                ),
+        with self._lock, self._conn:
+            run_id = self._conn.execute(
+                "INSERT INTO opportunity_runs (digest_id, item_count, opportunity_count, generated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (digest_id, item_count, len(opportunities), now),
+            ).lastrowid
+
+            self._conn.executemany(
+                INSERT_OPPORTUNITY_SQL,
+                [
+                    (
+                        opp.id, run_id, opp.title, opp.pain, opp.target_buyer,
+                        opp.solution_shape, opp.market_type, opp.effort_estimate,
+                        opp.monetization, opp.moat, opp.confidence,
+                        opp.competition_notes, now,
+                    )
+                    for opp in opportunities
+                ],
+            )
+            # After every opportunity row, so each evidence row's parent exists
+            self._conn.executemany(
+                INSERT_EVIDENCE_SQL,
+                [
+                    (opp.id, run_id, ev.source, ev.item_title, ev.url, ev.score)
+                    for opp in opportunities
+                    for ev in opp.evidence
+                ],
             )
-            for ev in opp.evidence:
-                self._conn.execute(
-                    """INSERT INTO opportunity_evidence
-                       (opportunity_id, run_id, source, item_title, url, score)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (opp.id, run_id, ev.source, ev.item_title, ev.url, ev.score),
-                )
-
-        self._conn.commit()
         return run_id
 
     def get_opportunities(
@@ -283,40 +627,52 @@ class Storage:
         conditions = ["o.confidence >= ?"]
         params: list = [min_confidence]
 
-        if target_buyer:
-            conditions.append("LOWER(o.target_buyer) LIKE ?")
-            params.append(f"%{target_buyer.lower()}%")
-        if market_type:
-            conditions.append("LOWER(o.market_type) LIKE ?")
-            params.append(f"%{market_type.lower()}%")
+        for column, value in (("target_buyer", target_buyer), ("market_type", market_type)):
+            if value:
+                condition, param = opportunity_text_filter(column, value, self._has_fts)
+                conditions.append(condition)
+                params.append(param)
         if since:
             conditions.append("o.generated_at >= ?")
             params.append(since)
 
         where = " AND ".join(conditions)
 
-        total = self._conn.execute(
-            f"SELECT COUNT(*) FROM opportunities o WHERE {where}", params
-        ).fetchone()[0]
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) FROM opportunities o WHERE {where}", params
+            ).fetchone()[0]
+
+            rows = self._conn.execute(
+                f"SELECT o.*, r.digest_id FROM opportunities o "
+                f"JOIN opportunity_runs r ON o.run_id = r.id "
+                f"WHERE {where} "
+                f"ORDER BY o.confidence DESC, o.generated_at DESC "
+                f"LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
 
-        rows = self._conn.execute(
-            f"SELECT o.*, r.digest_id FROM opportunities o "
-            f"JOIN opportunity_runs r ON o.run_id = r.id "
-            f"WHERE {where} "
-            f"ORDER BY o.confidence DESC, o.generated_at DESC "
-            f"LIMIT ? OFFSET ?",
-            params + [limit, offset],
-        ).fetchall()
+            # All evidence for the page in one query, bucketed by (id, run_id)
+            evidence: dict[tuple[str, int], list[dict]] = defaultdict(list)
+            if rows:
+                keys = [(row["id"], row["run_id"]) for row in rows]
+                values = ", ".join("(?, ?)" for _ in keys)
+                for ev in self._conn.execute(
+                    f"SELECT opportunity_id, run_id, source, item_title, url, score "
+                    f"FROM opportunity_evidence "
+                    f"WHERE (opportunity_id, run_id) IN (VALUES {values}) "
+                    f"ORDER BY id",
+                    [v for key in keys for v in key],
+                ):
+                    evidence[(ev["opportunity_id"], ev["run_id"])].append({
+                        "source": ev["source"],
+                        "item_title": ev["item_title"],
+                        "url": ev["url"],
+                        "score": ev["score"],
+                    })
 
         results = []
         for row in rows:
-            ev_rows = self._conn.execute(
-                "SELECT source, item_title, url, score "
-                "FROM opportunity_evidence "
-                "WHERE opportunity_id = ? AND run_id = ?",
-                (row["id"], row["run_id"]),
-            ).fetchall()
-
             results.append({
                 "id": row["id"],
                 "run_id": row["run_id"],
@@ -332,37 +688,30 @@ class Storage:
                 "competition_notes": row["competition_notes"],
                 "generated_at": row["generated_at"],
                 "digest_id": row["digest_id"],
-                "evidence": [
-                    {
-                        "source": ev["source"],
-                        "item_title": ev["item_title"],
-                        "url": ev["url"],
-                        "score": ev["score"],
-                    }
-                    for ev in ev_rows
-                ],
+                "evidence": evidence.get((row["id"], row["run_id"]), []),
             })
 
         return results, total
 
     def get_opportunity_by_id(self, opportunity_id: str) -> dict | None:
         """Get the latest version of an opportunity by its slug id."""
-        row = self._conn.execute(
-            "SELECT o.*, r.digest_id FROM opportunities o "
-            "JOIN opportunity_runs r ON o.run_id = r.id "
-            "WHERE o.id = ? ORDER BY o.generated_at DESC LIMIT 1",
-            (opportunity_id,),
-        ).fetchone()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT o.*, r.digest_id FROM opportunities o "
+                "JOIN opportunity_runs r ON o.run_id = r.id "
+                "WHERE o.id = ? ORDER BY o.generated_at DESC LIMIT 1",
+                (opportunity_id,),
+            ).fetchone()
 
-        if not row:
-            return None
+            if not row:
+                return None
 
-        ev_rows = self._conn.execute(
-            "SELECT source, item_title, url, score "
-            "FROM opportunity_evidence "
-            "WHERE opportunity_id = ? AND run_id = ?",
-            (row["id"], row["run_id"]),
-        ).fetchall()
+            ev_rows = self._conn.execute(
+                "SELECT source, item_title, url, score "
+                "FROM opportunity_evidence "
+                "WHERE opportunity_id = ? AND run_id = ?",
+                (row["id"], row["run_id"]),
+            ).fetchall()
 
         return {
             "id": row["id"],
@@ -395,42 +744,42 @@ class Storage:
         Get confidence trends per opportunity id across runs.
         Returns list of {id, title, data_points: [{run_id, confidence, generated_at}]}.
         """
-        rows = self._conn.execute(
-            "SELECT o.id, o.title, o.run_id, o.confidence, o.generated_at "
-            "FROM opportunities o "
-            "ORDER BY o.id, o.generated_at ASC"
-        ).fetchall()
+        with self._lock:
+            rows = self._conn.execute(OPPORTUNITY_TRENDS_SQL).fetchall()
 
-        trends: dict[str, dict] = {}
-        for row in rows:
-            oid = row["id"]
-            if oid not in trends:
-                trends[oid] = {
-                    "id": oid,
-                    "title": row["title"],
-                    "data_points": [],
-                }
-            trends[oid]["data_points"].append({
-                "run_id": row["run_id"],
-                "confidence": row["confidence"],
-                "generated_at": row["generated_at"],
-            })
-            # Keep title from latest run
-            trends[oid]["title"] = row["title"]
-
-        return list(trends.values())
+        decode = orjson.loads if ORDERED_AGGREGATES else sorted_trend_points
+        trends = []
+        for oid, title, points in rows:
+            trends.append({"id": oid, "title": title, "data_points": decode(points)})
+        return trends
 
     def _row_to_item(self, row: sqlite3.Row) -> Item:
+        """Build an Item from a row selected as _ITEM_COLUMNS (unpacked by position)."""
+        source, source_id, url, title, body, metadata, collected_at, score = row
         return Item(
-            source=Source(row["source"]),
-            source_id=row["source_id"],
-            url=row["url"],
-            title=row["title"],
-            body=row["body"],
-            metadata=json.loads(row["metadata"]),
-            collected_at=datetime.fromisoformat(row["collected_at"]),
-            score=row["score"],
+            source=_SOURCES[source],
+            source_id=source_id,
+            url=url,
+            title=title,
+            body=body,
+            metadata={} if metadata == "{}" else orjson.loads(metadata),
+            collected_at=datetime.fromisoformat(collected_at),
+            score=score,
         )
 
+    def vacuum(self):
+        """Rebuild the database file compactly, refresh planner stats, and truncate the WAL."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+            self._conn.execute("ANALYZE")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def close(self):
-        self._conn.close()
+        # Re-analyzes only tables whose stats have drifted; usually a no-op.
+        # Best effort: closing twice, or a read-only file, must not raise.
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            self._conn.close()
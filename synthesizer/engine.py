@@ -2,9 +2,12 @@
 Synthesis engine. Takes stored items + LLM provider, produces digests.
 """
 
-import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import orjson
 
 from llm.provider import LLMProvider, LLMError
 from models import Item, Digest, QAResult, Opportunity, EvidenceRef
@@ -21,19 +24,57 @@ from synthesizer.prompts import (
 log = logging.getLogger(__name__)
 
 
+def _url_key(url: str) -> str:
+    """
+    URL identity for cross-source duplicates: host without www., no trailing
+    slash, no fragment, no utm_* tracking params. Empty for non-URLs.
+    """
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return ""
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith("utm_")
+    ])
+    return f"{host}{parts.path.rstrip('/')}?{query}"
+
+
+def _fold_duplicates(items: list[Item], limit: int | None = None) -> list[Item]:
+    """
+    Drop items pointing at a URL an earlier item already covers (the same
+    post via HN and an RSS feed, say). Items arrive best-first, so the
+    highest-scored copy is the one kept. Stops once limit items are kept.
+    """
+    seen: set[str] = set()
+    unique = []
+    for item in items:
+        if len(unique) == limit:
+            break
+        key = _url_key(item.url)
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(item)
+    return unique
+
+
 def _format_items_for_prompt(items: list[Item], max_items: int = 30) -> str:
-    """Format items into a text block for the LLM prompt."""
+    """Format items into a text block for the LLM prompt, duplicates folded."""
     if not items:
         return "(no items collected)"
 
-    lines = []
-    for item in items[:max_items]:
-        lines.append(
-            f"[score={item.score}] [{item.source.value}] {item.title}\n"
-            f"  URL: {item.url}\n"
-            f"  {item.body[:500]}\n"
-        )
-    return "\n---\n".join(lines)
+    return "\n---\n".join([
+        f"[score={item.score}] [{item.source.value}] {item.title}\n"
+        f"  URL: {item.url}\n"
+        f"  {item.body[:500]}\n"
+        for item in _fold_duplicates(items, limit=max_items)
+    ])
+
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?")
+_BRACKET_RE = re.compile(r"[\[\]]")
 
 
 def _extract_json_array(text: str) -> str:
@@ -42,42 +83,87 @@ def _extract_json_array(text: str) -> str:
     Handles markdown code fences, leading/trailing text, etc.
     """
     # Strip markdown code fences
-    text = re.sub(r"```(?:json)?\s*\n?", "", text)
-    text = text.strip()
+    text = _FENCE_RE.sub("", text).strip()
 
     # Find the outermost [ ... ]
     start = text.find("[")
     if start == -1:
         raise ValueError("No JSON array found in response")
 
+    # Visit only the brackets; the regex skips everything between them in C
     depth = 0
-    end = -1
-    for i in range(start, len(text)):
-        if text[i] == "[":
+    for match in _BRACKET_RE.finditer(text, start):
+        if match.group() == "[":
             depth += 1
-        elif text[i] == "]":
+        else:
             depth -= 1
             if depth == 0:
-                end = i + 1
-                break
+                return text[start:match.end()]
 
-    if end == -1:
-        raise ValueError("Unbalanced brackets in JSON array")
+    raise ValueError("Unbalanced brackets in JSON array")
 
-    return text[start:end]
 
+def _local_repair(text: str) -> str:
+    """
+    Cheap fixes for the usual malformed output, tried before a repair
+    round-trip: trailing commas (outside strings only), and an array
+    truncated by max_tokens (cut back to the last complete element, then
+    closed). Raises ValueError if nothing usable is left.
+    """
+    text = _FENCE_RE.sub("", text)
+    start = text.find("[")
+    if start == -1:
+        raise ValueError("No JSON array found in response")
 
-VALID_EFFORT_ESTIMATES = {"weekend", "1-2 weeks", "month+"}
+    out: list[str] = []
+    depth = 0
+    last_complete = 0
+    comma = -1  # index in out of a comma with only whitespace after it so far
+    in_string = escaped = False
+    for ch in text[start:]:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch in "]}":
+            if comma >= 0:
+                del out[comma]  # trailing comma
+                comma = -1
+            depth -= 1
+            out.append(ch)
+            if depth == 0:
+                return "".join(out)
+            if depth == 1:
+                last_complete = len(out)
+            continue
+        elif not ch.isspace():
+            comma = len(out) if ch == "," else -1
+            if ch == '"':
+                in_string = True
+            elif ch in "[{":
+                depth += 1
+        out.append(ch)
+
+    if not last_complete:
+        raise ValueError("No complete JSON element to salvage")
+    return "".join(out[:last_complete]) + "]"
+
+
+VALID_EFFORT_ESTIMATES = frozenset({"weekend", "1-2 weeks", "month+"})
+_REQUIRED_STR_FIELDS = (
+    "id", "title", "pain", "target_buyer", "solution_shape",
+    "market_type", "effort_estimate", "monetization", "moat",
+)
+_REQUIRED_EVIDENCE_FIELDS = ("source", "item_title", "url")
 
 
 def _validate_opportunity_dict(d: dict) -> list[str]:
     """Validate a single opportunity dict. Returns list of error messages."""
     errors = []
-    required_str_fields = [
-        "id", "title", "pain", "target_buyer", "solution_shape",
-        "market_type", "effort_estimate", "monetization", "moat",
-    ]
-    for field in required_str_fields:
+    for field in _REQUIRED_STR_FIELDS:
         if field not in d or not isinstance(d[field], str) or not d[field].strip():
             errors.append(f"Missing or empty required field: {field}")
 
@@ -90,7 +176,7 @@ def _validate_opportunity_dict(d: dict) -> list[str]:
 
     if "effort_estimate" in d and d.get("effort_estimate") not in VALID_EFFORT_ESTIMATES:
         errors.append(
-            f"effort_estimate must be one of {VALID_EFFORT_ESTIMATES}, "
+            f"effort_estimate must be one of {sorted(VALID_EFFORT_ESTIMATES)}, "
             f"got '{d.get('effort_estimate')}'"
         )
 
@@ -103,7 +189,7 @@ def _validate_opportunity_dict(d: dict) -> list[str]:
             if not isinstance(ev, dict):
                 errors.append(f"evidence[{i}] must be an object")
                 continue
-            for ef in ["source", "item_title", "url"]:
+            for ef in _REQUIRED_EVIDENCE_FIELDS:
                 if ef not in ev or not isinstance(ev[ef], str) or not ev[ef].strip():
                     errors.append(f"evidence[{i}] missing field: {ef}")
 
@@ -116,7 +202,7 @@ def parse_opportunities_json(raw_text: str) -> list[Opportunity]:
     Raises ValueError with a descriptive message on failure.
     """
     json_str = _extract_json_array(raw_text)
-    data = json.loads(json_str)
+    data = orjson.loads(json_str)  # orjson.JSONDecodeError is a ValueError
 
     if not isinstance(data, list):
         raise ValueError(f"Expected JSON array, got {type(data).__name__}")
@@ -134,14 +220,15 @@ def parse_opportunities_json(raw_text: str) -> list[Opportunity]:
             all_errors.append(f"Item {i} ({item.get('id', '?')}): {'; '.join(errors)}")
             continue
 
-        evidence = []
-        for ev in item.get("evidence", []):
-            evidence.append(EvidenceRef(
+        evidence = [
+            EvidenceRef(
                 source=ev.get("source", ""),
                 item_title=ev.get("item_title", ""),
                 url=ev.get("url", ""),
                 score=int(ev.get("score", 0)),
-            ))
+            )
+            for ev in item["evidence"]
+        ]
 
         opportunities.append(Opportunity(
             id=item["id"],
@@ -177,9 +264,43 @@ class Synthesizer:
         self._llm = llm
         self._storage = storage
 
+    def run_reports(self, *reports: str) -> dict:
+        """
+        Run several report methods, by name (e.g. "daily_digest"), at once.
+        Each spends nearly all its time waiting on the LLM, so threads
+        overlap the round-trips. Returns {name: result} in argument order;
+        a report that raises is logged and maps to None, as on LLMError, so
+        the others are still returned.
+        """
+        if not reports:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(reports)) as pool:
+            futures = {name: pool.submit(getattr(self, name)) for name in reports}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception:
+                log.exception(f"Report {name} failed")
+                results[name] = None
+        return results
+
+    def _recent_items(self, days: int, min_score: int, max_items: int) -> tuple[list[Item], int]:
+        """
+        The best items of the last N days, as many as a prompt of max_items
+        can use (with headroom for duplicates folded away), and how many
+        items the window holds in all.
+        """
+        items = self._storage.get_items_last_n_days(
+            days=days, min_score=min_score, limit=max_items * 2,
+        )
+        if len(items) < max_items * 2:
+            return items, len(items)
+        return items, self._storage.count_items_last_n_days(days=days, min_score=min_score)
+
     def daily_digest(self) -> Digest | None:
         """Generate daily digest from today's items."""
-        items = self._storage.get_items_last_n_days(days=1, min_score=40)
+        items, total = self._recent_items(days=1, min_score=40, max_items=20)
 
         if not items:
             log.info("No items to digest today")
@@ -210,7 +331,7 @@ class Synthesizer:
         digest = Digest(
             digest_type="daily",
             content=response.text,
-            item_count=len(items),
+            item_count=total,
         )
 
         self._storage.save_digest("daily", digest.content, digest.item_count)
@@ -218,7 +339,7 @@ class Synthesizer:
 
     def weekly_synthesis(self) -> Digest | None:
         """Generate weekly synthesis from this week's items."""
-        items = self._storage.get_items_last_n_days(days=7, min_score=30)
+        items, total = self._recent_items(days=7, min_score=30, max_items=40)
 
         if not items:
             log.info("No items for weekly synthesis")
@@ -249,7 +370,7 @@ class Synthesizer:
         digest = Digest(
             digest_type="weekly",
             content=response.text,
-            item_count=len(items),
+            item_count=total,
         )
 
         self._storage.save_digest("weekly", digest.content, digest.item_count)
@@ -260,7 +381,7 @@ class Synthesizer:
         Generate a deep marketplace opportunity report (free-text).
         Uses a 14-day window to accumulate enough data for pattern detection.
         """
-        items = self._storage.get_items_last_n_days(days=14, min_score=35)
+        items, total = self._recent_items(days=14, min_score=35, max_items=50)
 
         if not items:
             log.info("No items for opportunity report")
@@ -292,7 +413,7 @@ class Synthesizer:
         digest = Digest(
             digest_type="opportunities",
             content=response.text,
-            item_count=len(items),
+            item_count=total,
         )
 
         self._storage.save_digest("opportunities", digest.content, digest.item_count)
@@ -303,10 +424,11 @@ class Synthesizer:
         Generate structured (JSON) opportunity report.
         Returns list of Opportunity objects, or None on failure.
 
-        Strategy: attempt JSON parse, retry once with repair prompt on failure.
+        Strategy: attempt JSON parse, then a local repair, then retry once
+        with the repair prompt.
         Also saves a free-text digest and the structured data to DB.
         """
-        items = self._storage.get_items_last_n_days(days=14, min_score=35)
+        items, total = self._recent_items(days=14, min_score=35, max_items=50)
 
         if not items:
             log.info("No items for structured opportunity report")
@@ -333,33 +455,19 @@ class Synthesizer:
 
         raw_text = response.text
 
-        # Parse attempt 1
+        # Parse attempt 1, then a local repair, then (only if both fail) a
+        # repair round-trip to the LLM
         try:
             opportunities = parse_opportunities_json(raw_text)
-        except (ValueError, json.JSONDecodeError) as first_error:
-            log.warning(f"First JSON parse failed: {first_error}. Attempting repair.")
-
-            # Retry with repair prompt
-            repair_prompt = STRUCTURED_OPPORTUNITY_REPAIR.format(
-                error=str(first_error),
-                raw=raw_text[:500],
-            )
+        except ValueError as first_error:
             try:
-                repair_response = self._llm.complete(
-                    system_prompt=STRUCTURED_OPPORTUNITY_SYSTEM,
-                    user_prompt=repair_prompt,
-                    temperature=0.1,
-                    max_tokens=3000,
-                )
-                raw_text = repair_response.text
-                opportunities = parse_opportunities_json(raw_text)
-                log.info("Repair succeeded.")
-            except (ValueError, json.JSONDecodeError, LLMError) as second_error:
-                log.error(
-                    f"Structured opportunity report failed after retry: {second_error}\n"
-                    f"Raw LLM output (first 300 chars): {response.text[:300]}"
-                )
-                return None
+                opportunities = parse_opportunities_json(_local_repair(raw_text))
+                log.warning(f"First JSON parse failed: {first_error}. Local repair succeeded.")
+            except ValueError:
+                log.warning(f"First JSON parse failed: {first_error}. Attempting repair.")
+                opportunities = self._repair_structured_report(raw_text, first_error)
+                if opportunities is None:
+                    return None
 
         if not opportunities:
             log.info("LLM returned no qualifying opportunities")
@@ -367,17 +475,11 @@ class Synthesizer:
 
         # Save a free-text digest alongside the structured data
         text_summary = _opportunities_to_text(opportunities)
-        self._storage.save_digest("opportunities", text_summary, len(items))
-
-        # Get the digest_id we just created
-        digest_row = self._storage._conn.execute(
-            "SELECT id FROM digests ORDER BY id DESC LIMIT 1"
-        ).fetchone()
-        digest_id = digest_row[0] if digest_row else None
+        digest_id = self._storage.save_digest("opportunities", text_summary, total)
 
         # Save structured data
         run_id = self._storage.save_opportunity_run(
-            opportunities, item_count=len(items), digest_id=digest_id,
+            opportunities, item_count=total, digest_id=digest_id,
         )
 
         # Attach run_id to returned objects
@@ -387,9 +489,34 @@ class Synthesizer:
         log.info(f"Saved {len(opportunities)} structured opportunities (run_id={run_id})")
         return opportunities
 
+    def _repair_structured_report(
+        self, raw_text: str, error: Exception,
+    ) -> list[Opportunity] | None:
+        """Ask the LLM to fix its malformed output. None if that fails too."""
+        repair_prompt = STRUCTURED_OPPORTUNITY_REPAIR.format(
+            error=str(error),
+            raw=raw_text[:500],
+        )
+        try:
+            repair_response = self._llm.complete(
+                system_prompt=STRUCTURED_OPPORTUNITY_SYSTEM,
+                user_prompt=repair_prompt,
+                temperature=0.1,
+                max_tokens=3000,
+            )
+            opportunities = parse_opportunities_json(repair_response.text)
+        except (ValueError, LLMError) as second_error:
+            log.error(
+                f"Structured opportunity report failed after retry: {second_error}\n"
+                f"Raw LLM output (first 300 chars): {raw_text[:300]}"
+            )
+            return None
+        log.info("Repair succeeded.")
+        return opportunities
+
     def ask(self, question: str, days: int = 7) -> QAResult | None:
         """Answer a question based on recent items."""
-        items = self._storage.get_items_last_n_days(days=days, min_score=20)
+        items, total = self._recent_items(days=days, min_score=20, max_items=30)
 
         formatted = _format_items_for_prompt(items, max_items=30)
         prompt = QA_USER.format(items=formatted, question=question, days=days)
@@ -408,7 +535,7 @@ class Synthesizer:
         return QAResult(
             question=question,
             answer=response.text,
-            sources_used=len(items),
+            sources_used=total,
         )
 
 
@@ -0,0 +1,28 @@
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Project root on the path for imports, once per session
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from storage.db import Storage  # noqa: E402
+
+# RAM-backed temp dir where available, so test databases never touch disk
+TMP_DIR = "/dev/shm" if Path("/dev/shm").is_dir() else None
+
+
+@pytest.fixture
+def db_path():
+    """Path for a database file in a fresh temp dir, removed afterwards."""
+    with tempfile.TemporaryDirectory(dir=TMP_DIR) as tmpdir:
+        yield Path(tmpdir) / "test.db"
+
+
+@pytest.fixture
+def storage(db_path):
+    """A Storage over a new database at db_path."""
+    storage = Storage(db_path)
+    yield storage
+    storage.close()
@@ -0,0 +1,54 @@
+"""
+Tests for the content-hash Bloom filter: membership, serialization, saturation.
+"""
+
+import pytest
+
+from storage.bloom import BloomFilter
+
+
+def _keys(prefix, n):
+    return [f"{prefix}-{i}" for i in range(n)]
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=2000)
+        keys = _keys("added", 2000)
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(capacity=5000, error_rate=0.001)
+        for key in _keys("added", 5000):
+            bloom.add(key)
+        false_positives = sum(key in bloom for key in _keys("absent", 20000))
+        # ~20 expected at 0.1%; allow generous slack for hash variance
+        assert false_positives < 60
+
+    def test_round_trip(self):
+        bloom = BloomFilter(capacity=100)
+        for key in _keys("added", 60):
+            bloom.add(key)
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        assert restored.to_bytes() == bloom.to_bytes()
+        assert (restored.capacity, restored.count) == (100, 60)
+        assert all(key in restored for key in _keys("added", 60))
+
+    def test_from_bytes_rejects_bad_buffers(self):
+        data = BloomFilter(capacity=100).to_bytes()
+        with pytest.raises(ValueError, match="truncated"):
+            BloomFilter.from_bytes(data[:10])
+        with pytest.raises(ValueError, match="corrupt"):
+            BloomFilter.from_bytes(data[:-1])
+
+    def test_saturated_past_capacity(self):
+        bloom = BloomFilter(capacity=10)
+        for key in _keys("added", 10):
+            bloom.add(key)
+        assert not bloom.saturated
+        bloom.add("one-more")
+        assert bloom.saturated
+        assert BloomFilter.from_bytes(bloom.to_bytes()).saturated
@@ -0,0 +1,170 @@
+"""
+Tests for collectors against stubbed HTTP responses. No network.
+"""
+
+from unittest import mock
+
+import orjson
+import requests
+
+from collectors.github import GitHubCollector
+from collectors.nvd import NVDCollector
+from config.settings import Config
+from models import Item, Source
+
+REPO = "acme/widgets"
+RELEASES_URL = f"https://api.github.com/repos/{REPO}/releases"
+
+
+def _response(status_code=200, payload=None, headers=None):
+    resp = mock.Mock(spec=requests.Response)
+    resp.status_code = status_code
+    resp.headers = headers or {}
+    resp.content = orjson.dumps(payload if payload is not None else [])
+    return resp
+
+
+def _release(tag):
+    return {
+        "tag_name": tag, "body": "notes", "html_url": f"https://github.com/{REPO}/{tag}",
+        "prerelease": False, "created_at": "2026-01-01T00:00:00Z",
+    }
+
+
+def _github(storage, token="secret-token"):
+    return GitHubCollector(storage, Config(github_repos=[REPO], github_token=token))
+
+
+def _releases_calls(get):
+    return [c for c in get.call_args_list if c.args[0] == RELEASES_URL]
+
+
+class TestGitHubCollector:
+    def test_validators_stored_and_sent(self, storage):
+        validators = {"ETag": 'W/"abc"', "Last-Modified": "Wed, 01 Jan 2026 00:00:00 GMT"}
+
+        def first_run(url, **kwargs):
+            if url == RELEASES_URL:
+                return _response(payload=[_release("v1.0.0")], headers=validators)
+            return _response()
+
+        collector = _github(storage)
+        with mock.patch.object(collector._session, "get", side_effect=first_run) as get:
+            items = collector.collect()
+        assert [item.source_id for item in items] == [f"{REPO}:v1.0.0"]
+        assert "If-None-Match" not in _releases_calls(get)[0].kwargs["headers"]
+
+        # Nothing is saved until the items are stored and the run commits
+        assert storage.get_collector_state("github") == {}
+        storage.insert_items(items)
+        collector.commit()
+        state = storage.get_collector_state("github")
+        assert state["http_validators"][RELEASES_URL] == [validators["ETag"], validators["Last-Modified"]]
+
+        # Next run sends the validators back; a 304 yields nothing and keeps them
+        collector = _github(storage)
+        with mock.patch.object(collector._session, "get", return_value=_response(304)) as get:
+            assert collector.collect() == []
+        collector.commit()
+        headers = _releases_calls(get)[0].kwargs["headers"]
+        assert headers["If-None-Match"] == validators["ETag"]
+        assert headers["If-Modified-Since"] == validators["Last-Modified"]
+        state = storage.get_collector_state("github")
+        assert state["http_validators"][RELEASES_URL] == [validators["ETag"], validators["Last-Modified"]]
+
+    def test_uncommitted_run_refetches(self, storage):
+        def get(url, **kwargs):
+            if url == RELEASES_URL:
+                return _response(payload=[_release("v1.0.0")], headers={"ETag": 'W/"abc"'})
+            return _response()
+
+        collector = _github(storage)
+        with mock.patch.object(collector._session, "get", side_effect=get):
+            assert collector.collect()
+        # The insert failed, so commit() never ran: the next run asks again
+        collector = _github(storage)
+        with mock.patch.object(collector._session, "get", return_value=_response()) as get:
+            collector.collect()
+        assert "If-None-Match" not in _releases_calls(get)[0].kwargs["headers"]
+
+    def test_not_modified_returns_none(self, storage):
+        collector = _github(storage)
+        with mock.patch.object(collector._session, "get", return_value=_response(304)):
+            assert collector._request(RELEASES_URL) is None
+
+    def test_rejected_token_falls_back_per_request(self, storage):
+        collector = _github(storage)
+        responses = iter([_response(401), _response(payload=[_release("v2.0.0")]), _response()])
+        sent = []
+
+        def get(url, headers, **kwargs):
+            sent.append(dict(headers))  # the retry reuses and updates the dict
+            return next(responses)
+
+        with mock.patch.object(collector._session, "get", side_effect=get):
+            resp = collector._request(RELEASES_URL)
+            collector._request(RELEASES_URL)
+
+        assert resp is not None and resp.status_code == 200
+        first, retry, later = sent
+        assert "Authorization" not in first
+        assert retry["Authorization"] is None
+        assert later["Authorization"] is None
+
+        # The shared session keeps its token; requests drops the None override
+        assert collector._session.headers["Authorization"] == "token secret-token"
+        prepared = collector._session.prepare_request(
+            requests.Request("GET", RELEASES_URL, headers=retry)
+        )
+        assert "Authorization" not in prepared.headers
+
+
+def _cve(n, cvss=9.8):
+    return {"cve": {
+        "id": f"CVE-2026-{n:04d}",
+        "descriptions": [{"lang": "en", "value": f"Flaw number {n}"}],
+        "metrics": {"cvssMetricV31": [{"cvssData": {"baseScore": cvss, "baseSeverity": "CRITICAL"}}]},
+    }}
+
+
+class TestNVDCollector:
+    def test_pages_throttles_and_dedups(self, storage):
+        # Already collected on an earlier run: skipped without parsing
+        storage.insert_items([Item(
+            source=Source.NVD_CVE, source_id="nvd:CVE-2026-0003",
+            url="https://nvd.nist.gov/vuln/detail/CVE-2026-0003", title="old", body="old",
+        )])
+        # 120 results over pages of 50, 50 and 20; every tenth is below min CVSS
+        cves = [_cve(n, cvss=5.0 if n % 10 == 0 else 9.8) for n in range(120)]
+
+        def get(url, params, **kwargs):
+            start, count = params["startIndex"], params["resultsPerPage"]
+            return _response(payload={
+                "totalResults": 500, "vulnerabilities": cves[start:start + count],
+            })
+
+        collector = NVDCollector(storage, Config(nvd_max_results=120, nvd_min_cvss=7.0, nvd_api_key=""))
+        with mock.patch.object(collector._session, "get", side_effect=get) as session_get, \
+                mock.patch("collectors.nvd.time") as clock:
+            clock.monotonic.return_value = 1000.0
+            items = collector.collect()
+
+        pages = [(c.kwargs["params"]["startIndex"], c.kwargs["params"]["resultsPerPage"])
+                 for c in session_get.call_args_list]
+        assert pages == [(0, 50), (50, 50), (100, 20)]
+        # Unkeyed rate limit: 6s between requests, none before the first
+        assert [c.args[0] for c in clock.sleep.call_args_list] == [6.0, 6.0]
+
+        expected = {f"nvd:CVE-2026-{n:04d}" for n in range(120) if n % 10 and n != 3}
+        assert {item.source_id for item in items} == expected
+        assert len(items) == len(expected)
+
+    def test_parse_page_skips_stored(self, storage):
+        collector = NVDCollector(storage, Config(nvd_min_cvss=7.0))
+        first = collector._parse_page([_cve(1), _cve(2), {"cve": {}}])
+        assert [item.source_id for item in first] == ["nvd:CVE-2026-0001", "nvd:CVE-2026-0002"]
+
+        storage.insert_items(first)
+        collector._load_known(Source.NVD_CVE)
+        again = collector._parse_page([_cve(1), _cve(2), _cve(4)])
+        assert [item.source_id for item in again] == ["nvd:CVE-2026-0004"]
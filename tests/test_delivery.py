@@ -0,0 +1,55 @@
+"""
+Tests for email delivery: several messages share one SMTP connection.
+"""
+
+from unittest import mock
+
+from config.settings import Config
+from delivery import deliver_emails
+from models import Digest
+
+
+def _config(**overrides):
+    values = dict(
+        smtp_host="smtp.example.com", smtp_port=587,
+        smtp_user="user", smtp_pass="secret",
+        email_to="team@example.com",
+    )
+    values.update(overrides)
+    return Config(**values)
+
+
+def _digests():
+    return [
+        Digest(digest_type=kind, content=f"{kind} body", item_count=3)
+        for kind in ("daily", "weekly", "opportunities")
+    ]
+
+
+class TestDeliverEmails:
+    def test_messages_share_one_connection(self):
+        with mock.patch("delivery.output.smtplib.SMTP") as smtp:
+            sent = deliver_emails(_digests(), _config())
+
+        assert sent == 3
+        smtp.assert_called_once_with("smtp.example.com", 587, timeout=30)
+        server = smtp.return_value
+        server.starttls.assert_called_once()
+        server.login.assert_called_once_with("user", "secret")
+        assert server.send_message.call_count == 3
+        subjects = [call.args[0]["Subject"] for call in server.send_message.call_args_list]
+        assert [s.split()[1] for s in subjects] == ["daily", "weekly", "opportunities"]
+        server.quit.assert_called_once()
+
+    def test_failed_send_reconnects_for_the_next(self):
+        with mock.patch("delivery.output.smtplib.SMTP") as smtp:
+            smtp.return_value.send_message.side_effect = [OSError("reset"), None, None]
+            sent = deliver_emails(_digests(), _config())
+
+        assert sent == 2
+        assert smtp.call_count == 2
+
+    def test_unconfigured_sends_nothing(self):
+        with mock.patch("delivery.output.smtplib.SMTP") as smtp:
+            assert deliver_emails(_digests(), _config(smtp_host="")) == 0
+        smtp.assert_not_called()
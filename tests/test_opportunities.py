@@ -6,25 +6,22 @@ Tests for structured opportunity intelligence:
 """
 
 import json
-import sqlite3
 import tempfile
-from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
-import sys
-
-# Add project root to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models import Opportunity, EvidenceRef, Item, Source
 from synthesizer.engine import (
     _extract_json_array,
+    _fold_duplicates,
+    _local_repair,
     _validate_opportunity_dict,
     parse_opportunities_json,
     VALID_EFFORT_ESTIMATES,
 )
-from storage.db import Storage
+from storage.db import Storage, sorted_trend_points
+from tests.conftest import TMP_DIR
 
 
 # ──────────────────────────────────────────────
@@ -63,22 +60,11 @@ def _make_valid_json_response(**overrides):
     return json.dumps([_make_valid_opportunity_dict(**overrides)])
 
 
-@pytest.fixture
-def tmp_storage():
-    """Create a temporary Storage instance for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        storage = Storage(db_path)
-        yield storage
-        storage.close()
-
-
-@pytest.fixture
-def populated_storage(tmp_storage):
-    """Storage with some items and opportunities pre-loaded."""
-    # Insert some items
-    for i in range(5):
-        item = Item(
+def _populate(storage: Storage) -> int:
+    """Load some items, a digest and an opportunity run. Returns the run_id."""
+    # Insert some items, in one transaction
+    assert storage.insert_items([
+        Item(
             source=Source.GITHUB_ISSUE,
             source_id=f"test-{i}",
             url=f"https://example.com/{i}",
@@ -86,10 +72,11 @@ def populated_storage(tmp_storage):
             body=f"Body of test item {i}",
             score=50 + i * 10,
         )
-        tmp_storage.insert_item(item)
+        for i in range(5)
+    ]) == 5
 
     # Save a digest
-    tmp_storage.save_digest("opportunities", "Test digest content", 5)
+    storage.save_digest("opportunities", "Test digest content", 5)
 
     # Create opportunities
     opps = [
@@ -136,8 +123,13 @@ def populated_storage(tmp_storage):
             competition_notes="Vault is complex, CyberArk is enterprise-only.",
         ),
     ]
-    run_id = tmp_storage.save_opportunity_run(opps, item_count=5, digest_id=1)
-    return tmp_storage, run_id
+    return storage.save_opportunity_run(opps, item_count=5, digest_id=1)
+
+
+@pytest.fixture
+def populated_storage(storage):
+    """Storage with some items and opportunities pre-loaded."""
+    return storage, _populate(storage)
 
 
 # ──────────────────────────────────────────────
@@ -172,6 +164,23 @@ class TestExtractJsonArray:
             _extract_json_array("[{incomplete")
 
 
+class TestLocalRepair:
+    def test_trailing_commas(self):
+        assert json.loads(_local_repair('[{"a": 1, "b": [2,],},]')) == [{"a": 1, "b": [2]}]
+
+    def test_commas_inside_strings_kept(self):
+        text = '[{"a": "x,}", "b": "y, ]", "c": "q\\",}",},]'
+        assert json.loads(_local_repair(text)) == [{"a": "x,}", "b": "y, ]", "c": 'q",}'}]
+
+    def test_truncated_array_keeps_complete_elements(self):
+        text = '```json\n[{"a": "x]"}, {"b": 2}, {"c": "trunc'
+        assert json.loads(_local_repair(text)) == [{"a": "x]"}, {"b": 2}]
+
+    def test_nothing_to_salvage(self):
+        with pytest.raises(ValueError):
+            _local_repair('[{"a": "trunc')
+
+
 # ──────────────────────────────────────────────
 # Validation tests
 # ──────────────────────────────────────────────
@@ -302,12 +311,42 @@ class TestParseOpportunitiesJson:
         assert opps[0].evidence[0].score == 0
 
 
+class TestFoldDuplicates:
+    def test_keeps_first_copy_of_same_url(self):
+        items = [
+            Item(source=Source.HACKER_NEWS, source_id="hn:1", url="https://www.example.com/post/",
+                 title="Post", body="", score=80),
+            Item(source=Source.RSS, source_id="rss:1", url="https://example.com/post?utm_source=rss",
+                 title="[Blog] Post", body="", score=50),
+            Item(source=Source.RSS, source_id="rss:2", url="https://example.com/other",
+                 title="[Blog] Other", body="", score=40),
+            Item(source=Source.RSS, source_id="rss:3", url="", title="No link", body="", score=30),
+            Item(source=Source.RSS, source_id="rss:4", url="", title="No link", body="", score=20),
+        ]
+        assert [i.source_id for i in _fold_duplicates(items)] == ["hn:1", "rss:2", "rss:3", "rss:4"]
+
+
 # ──────────────────────────────────────────────
 # Database tests
 # ──────────────────────────────────────────────
 
 class TestOpportunityDB:
-    def test_save_and_retrieve(self, tmp_storage):
+    def test_connection_pragmas(self, storage):
+        conn = storage._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    def test_opportunity_history_uses_index(self, storage):
+        # Trends and the API's latest-version lookup walk one id's runs in time order
+        plan = " ".join(row[3] for row in storage._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM opportunities "
+            "WHERE id = ? ORDER BY generated_at DESC LIMIT 1", ("x",)
+        ))
+        assert "idx_opportunities_id_generated" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_save_and_retrieve(self, storage):
         opp = Opportunity(
             id="test-opp",
             title="Test Opportunity",
@@ -328,12 +367,12 @@ class TestOpportunityDB:
                 )
             ],
         )
-        run_id = tmp_storage.save_opportunity_run([opp], item_count=10)
+        run_id = storage.save_opportunity_run([opp], item_count=10)
         assert run_id is not None
         assert run_id > 0
 
         # Retrieve
-        result = tmp_storage.get_opportunity_by_id("test-opp")
+        result = storage.get_opportunity_by_id("test-opp")
         assert result is not None
         assert result["id"] == "test-opp"
         assert result["confidence"] == 90
@@ -376,8 +415,34 @@ class TestOpportunityDB:
         assert len(results) == 1
         assert results[0]["id"] != first_id
 
-    def test_get_opportunity_by_id_not_found(self, tmp_storage):
-        result = tmp_storage.get_opportunity_by_id("nonexistent")
+    def test_text_filters_match_without_fts(self, populated_storage, monkeypatch):
+        storage, _ = populated_storage
+
+        with tempfile.TemporaryDirectory(dir=TMP_DIR) as tmpdir:
+            # A build without FTS5 trigram, as on SQLite < 3.34
+            monkeypatch.setattr("storage.db.fts_trigram_available", lambda conn: False)
+            fallback = Storage(Path(tmpdir) / "test.db")
+            try:
+                _populate(fallback)
+                for value in ("DevOps lead", "devops", "ops", "de", "O", "c", "/g", "%", "_"):
+                    for column in ("target_buyer", "market_type"):
+                        indexed, indexed_total = storage.get_opportunities(**{column: value})
+                        scanned, scanned_total = fallback.get_opportunities(**{column: value})
+                        assert indexed_total == scanned_total, (column, value)
+                        assert [r["id"] for r in indexed] == [r["id"] for r in scanned]
+            finally:
+                fallback.close()
+
+    def test_get_opportunities_attaches_evidence(self, populated_storage):
+        storage, _ = populated_storage
+
+        results, _ = storage.get_opportunities()
+        evidence = {r["id"]: r["evidence"] for r in results}
+        assert [e["source"] for e in evidence["terraform-drift-detector"]] == ["github_issue"]
+        assert [e["source"] for e in evidence["secrets-rotation-saas"]] == ["hacker_news"]
+
+    def test_get_opportunity_by_id_not_found(self, storage):
+        result = storage.get_opportunity_by_id("nonexistent")
         assert result is None
 
     def test_opportunity_trends(self, populated_storage):
@@ -390,6 +455,14 @@ class TestOpportunityDB:
             assert len(t["data_points"]) == 1
             assert t["data_points"][0]["run_id"] == run_id
 
+    def test_trend_points_sorted_oldest_first(self):
+        points = json.dumps([
+            {"run_id": 3, "confidence": 90, "generated_at": "2026-03-01T00:00:00"},
+            {"run_id": 1, "confidence": 70, "generated_at": "2026-01-01T00:00:00"},
+            {"run_id": 2, "confidence": 80, "generated_at": "2026-01-01T00:00:00"},
+        ])
+        assert [p["run_id"] for p in sorted_trend_points(points)] == [1, 2, 3]
+
     def test_multiple_runs_create_trends(self, populated_storage):
         storage, first_run_id = populated_storage
 
@@ -420,7 +493,9 @@ class TestOpportunityDB:
 
         trends = storage.get_opportunity_trends()
         tf_trend = next(t for t in trends if t["id"] == "terraform-drift-detector")
+        assert tf_trend["title"] == "Terraform Drift Detector v2"
         assert len(tf_trend["data_points"]) == 2
+        assert [p["run_id"] for p in tf_trend["data_points"]] == [first_run_id, second_run_id]
         assert tf_trend["data_points"][0]["confidence"] == 82
         assert tf_trend["data_points"][1]["confidence"] == 90
 
@@ -429,12 +504,26 @@ class TestOpportunityDB:
 # API tests
 # ──────────────────────────────────────────────
 
-class TestOpportunitiesAPI:
-    @pytest.fixture
-    def client(self, populated_storage):
-        storage, _ = populated_storage
-        # Get db_path from the storage connection
-        db_path = Path(storage._conn.execute("PRAGMA database_list").fetchone()[2])
+# Top-scoring item with a long body, for the /api/items list view
+LONG_BODY = "é" * 300 + "x" * 700
+
+
+@pytest.fixture(scope="module")
+def client():
+    """API test client over a populated database. The API tests only read, so one is shared."""
+    with tempfile.TemporaryDirectory(dir=TMP_DIR) as tmpdir:
+        db_path = Path(tmpdir) / "test.db"
+        storage = Storage(db_path)
+        _populate(storage)
+        storage.insert_items([Item(
+            source=Source.HACKER_NEWS,
+            source_id="long",
+            url="https://example.com/long",
+            title="Long item",
+            body=LONG_BODY,
+            metadata={"score": 120, "tags": ["ci", "flaky"], "author": {"name": "Zoë", "karma": None}},
+            score=95,
+        )])
         storage.close()
 
         from api.server import create_app
@@ -443,6 +532,8 @@ class TestOpportunitiesAPI:
         with app.test_client() as client:
             yield client
 
+
+class TestOpportunitiesAPI:
     def test_list_opportunities(self, client):
         resp = client.get("/api/opportunities")
         assert resp.status_code == 200
@@ -467,6 +558,22 @@ class TestOpportunitiesAPI:
         data = resp.get_json()
         assert data["total"] == 2
 
+    def test_text_filter_uses_trigram_index(self, client):
+        # Trace the pooled connection the next request checks out (LIFO)
+        pool = client.application.extensions["read_pool"]
+        conn = pool.acquire()
+        statements = []
+        conn.set_trace_callback(statements.append)
+        pool.release(conn)
+        try:
+            data = client.get("/api/opportunities?buyer=devops").get_json()
+        finally:
+            conn.set_trace_callback(None)
+
+        assert data["total"] == 1
+        assert any("opportunities_fts MATCH" in sql for sql in statements)
+        assert not any("LIKE" in sql for sql in statements)
+
     def test_list_opportunities_invalid_confidence(self, client):
         resp = client.get("/api/opportunities?min_confidence=abc")
         assert resp.status_code == 400
@@ -489,6 +596,20 @@ class TestOpportunitiesAPI:
         resp = client.get("/api/opportunities/nonexistent-thing")
         assert resp.status_code == 404
 
+    def test_head_digests_returns_connection(self, client):
+        pool = client.application.extensions["read_pool"]
+        client.get("/api/digests")
+        idle = pool._idle.qsize()
+        for _ in range(5):
+            assert client.head("/api/digests").status_code == 200
+        assert pool._idle.qsize() == idle
+
+    def test_response_cache_ignores_query_string(self, client):
+        cache = client.application.extensions["response_cache"]
+        bodies = {client.get(f"/api/stats?x={i}").data for i in range(20)}
+        assert len(bodies) == 1
+        assert sum(1 for key in cache if key[0] == "get_stats") == 1
+
     def test_opportunity_trends(self, client):
         resp = client.get("/api/opportunities/trends")
         assert resp.status_code == 200
@@ -509,3 +630,75 @@ class TestOpportunitiesAPI:
     def test_invalid_offset(self, client):
         resp = client.get("/api/opportunities?offset=notanumber")
         assert resp.status_code == 400
+
+    def test_negative_offset(self, client):
+        resp = client.get("/api/opportunities?offset=-1")
+        assert resp.status_code == 400
+
+
+class TestDashboardAPI:
+    def test_items_body_truncated(self, client):
+        data = client.get("/api/items").get_json()
+        top = data["items"][0]
+        assert top["source_id"] == "long"
+        # substr counts characters, not bytes: multi-byte text is cut cleanly
+        assert top["body"] == LONG_BODY[:500]
+        assert data["items"][1]["body"] == "Body of test item 4"
+
+    def test_items_metadata_passed_through(self, client):
+        resp = client.get("/api/items?source=hacker_news")
+        data = resp.get_json()
+        assert data["total"] == 1
+        assert data["items"][0]["metadata"] == {
+            "score": 120, "tags": ["ci", "flaky"], "author": {"name": "Zoë", "karma": None},
+        }
+        # Items stored without metadata still come back as an object
+        data = client.get("/api/items?source=github_issue&limit=1").get_json()
+        assert data["items"][0]["metadata"] == {}
+
+    def test_digests_streamed_json(self, client):
+        resp = client.get("/api/digests")
+        assert resp.status_code == 200
+        assert resp.is_streamed and resp.mimetype == "application/json"
+        digests = resp.get_json()["digests"]
+        assert [(d["id"], d["digest_type"], d["content"], d["item_count"]) for d in digests] == [
+            (1, "opportunities", "Test digest content", 5),
+        ]
+        assert digests[0]["generated_at"]
+
+        assert client.get("/api/digests?type=opportunities").get_json() == {"digests": digests}
+        assert client.get("/api/digests?type=daily").get_json() == {"digests": []}
+
+    def test_head_digests(self, client):
+        resp = client.head("/api/digests")
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/json"
+        assert resp.data == b""
+
+    def test_stats(self, client):
+        data = client.get("/api/stats").get_json()
+        latest = data.pop("latest_collection")
+        assert latest and latest.startswith("20")
+        assert data == {
+            "total_items": 6,
+            "total_digests": 1,
+            "by_source": {"github_issue": 5, "hacker_news": 1},
+            "by_digest_type": {"opportunities": 1},
+            # test items score 50, 60, 70, 80, 90; the long item 95
+            "score_distribution": {"41-60": 2, "61-80": 2, "81-100": 2},
+        }
+
+    def test_items_params(self, client):
+        data = client.get("/api/items?min_score=80&limit=2&offset=1").get_json()
+        assert (data["total"], data["limit"], data["offset"]) == (3, 2, 1)
+        assert [item["score"] for item in data["items"]] == [90, 80]
+
+        # Oversized pages are clamped, not rejected
+        data = client.get("/api/items?limit=10000").get_json()
+        assert data["limit"] == 200 and len(data["items"]) == 6
+
+    def test_items_invalid_params(self, client):
+        for query in ("min_score=abc", "min_score=-1", "limit=x", "offset=-5"):
+            resp = client.get(f"/api/items?{query}")
+            assert resp.status_code == 400, query
+            assert "error" in resp.get_json()
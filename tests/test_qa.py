@@ -0,0 +1,66 @@
+"""
+Tests for the Q&A answer cache: hits, invalidation on new items, and TTL.
+"""
+
+from datetime import datetime, timezone, timedelta
+from unittest import mock
+
+from models import Item, QAResult, Source
+from qa.handler import QA_CACHE_TTL, QAHandler
+
+
+def _handler(storage, age=timedelta(0)):
+    """A QAHandler whose synthesizer answers without an LLM, generated age ago."""
+    handler = QAHandler(mock.Mock(), storage)
+    handler._synthesizer = mock.Mock()
+    handler._synthesizer.ask.side_effect = lambda question, days: QAResult(
+        question=question, answer=f"answer {handler._synthesizer.ask.call_count}",
+        sources_used=3, generated_at=datetime.now(timezone.utc) - age,
+    )
+    return handler
+
+
+def _store_item(storage, n):
+    storage.insert_items([Item(
+        source=Source.RSS, source_id=f"rss-{n}", url=f"https://example.com/{n}",
+        title=f"Item {n}", body="body",
+    )])
+
+
+class TestQACache:
+    def test_repeat_question_hits_cache(self, storage):
+        _store_item(storage, 1)
+        handler = _handler(storage)
+
+        first = handler.ask("Which CI tools are flaky?")
+        again = handler.ask("  which CI tools   are FLAKY? ")
+        assert handler._synthesizer.ask.call_count == 1
+        assert again.answer == first.answer == "answer 1"
+        assert again.question == "  which CI tools   are FLAKY? "
+
+        # A different window is a different question
+        handler.ask("Which CI tools are flaky?", days=30)
+        assert handler._synthesizer.ask.call_count == 2
+
+    def test_new_items_invalidate(self, storage):
+        _store_item(storage, 1)
+        handler = _handler(storage)
+
+        handler.ask("Which CI tools are flaky?")
+        _store_item(storage, 2)
+        assert handler.ask("Which CI tools are flaky?").answer == "answer 2"
+        assert handler.ask("Which CI tools are flaky?").answer == "answer 2"
+        assert handler._synthesizer.ask.call_count == 2
+
+    def test_expires_after_ttl(self, storage):
+        _store_item(storage, 1)
+
+        fresh = _handler(storage, age=QA_CACHE_TTL - timedelta(minutes=5))
+        fresh.ask("Which CI tools are flaky?")
+        fresh.ask("Which CI tools are flaky?")
+        assert fresh._synthesizer.ask.call_count == 1
+
+        stale = _handler(storage, age=QA_CACHE_TTL + timedelta(minutes=5))
+        stale.ask("What breaks in Terraform?")
+        stale.ask("What breaks in Terraform?")
+        assert stale._synthesizer.ask.call_count == 2
@@ -0,0 +1,52 @@
+"""
+Tests for deterministic scoring: pattern matching is case-insensitive and
+gives the same scores whichever matching backend is installed.
+"""
+
+import re
+
+from filters.scorer import (
+    ENTERPRISE_SIGNAL_PATTERNS,
+    HIGH_SIGNAL_PATTERNS,
+    LOW_SIGNAL_PATTERNS,
+    _pattern_score,
+    score_item,
+)
+from models import Item, Source
+
+
+def _item(title, body):
+    return Item(
+        source=Source.RSS, source_id="test", url="https://example.com",
+        title=title, body=body,
+    )
+
+
+class TestPatternCase:
+    def test_mixed_case_scores_as_lowercase(self):
+        for text in (
+            "Breaking Change: Deprecated API removed after the Outage",
+            "Flaky Tests keep failing in CI; we need a Merge Queue",
+            "SOC 2 Type 2 audit trail for HIPAA and GDPR",
+        ):
+            assert _pattern_score(text) > 0, text
+            assert _pattern_score(text) == _pattern_score(text.lower()), text
+            assert _pattern_score(text) == _pattern_score(text.upper()), text
+
+    def test_item_score_ignores_case(self):
+        body = "The CI Is Flaky and the Post-Mortem found a Memory Leak. " * 4
+        mixed = score_item(_item("Incident Report: Rolled Back", body))
+        lower = score_item(_item("incident report: rolled back", body.lower()))
+        assert mixed.score == lower.score
+
+
+class TestPatternBackends:
+    def test_non_ascii_word_boundaries_follow_re(self):
+        # RE2 and Hyperscan treat é as a non-word character, re does not
+        for text in ("éoutage reported", "an outageé", "café outage", "Straße regression"):
+            expected = sum(
+                delta
+                for pattern, delta in HIGH_SIGNAL_PATTERNS + ENTERPRISE_SIGNAL_PATTERNS + LOW_SIGNAL_PATTERNS
+                if re.search(pattern, text, re.IGNORECASE)
+            )
+            assert _pattern_score(text) == expected, text
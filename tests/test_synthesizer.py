@@ -0,0 +1,22 @@
+"""
+Tests for running several synthesizer reports at once.
+"""
+
+import sqlite3
+from unittest import mock
+
+from models import Digest
+from synthesizer.engine import Synthesizer
+
+
+class TestRunReports:
+    def test_failed_report_maps_to_none(self):
+        synthesizer = Synthesizer(mock.Mock(), mock.Mock())
+        daily = Digest(digest_type="daily", content="daily body", item_count=3)
+        synthesizer.daily_digest = mock.Mock(return_value=daily)
+        synthesizer.weekly_synthesis = mock.Mock(side_effect=sqlite3.OperationalError("locked"))
+        synthesizer.opportunity_report = mock.Mock(return_value=None)
+
+        results = synthesizer.run_reports("daily_digest", "weekly_synthesis", "opportunity_report")
+        assert results == {"daily_digest": daily, "weekly_synthesis": None, "opportunity_report": None}
+        assert list(results) == ["daily_digest", "weekly_synthesis", "opportunity_report"]